@@ -1,14 +1,17 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
-from io import BytesIO
-from reportlab.lib.pagesizes import A4
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib import colors
-from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
 import base64
+import os
+import re
+from functools import partial
+import artifacts
+import dashboard_data
+import figure_cache
+import gantt
+import render_service
+import reports
+import sheet_loader
 
 # Page config
 st.set_page_config(
@@ -18,136 +21,186 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Google Drive CSV links
-CORE_PM_CSV = "https://docs.google.com/spreadsheets/d/e/2PACX-1vTFJ959Chtv5sEuQ-PTyXQDyulOUr86vNMVifjCcw_WWhPJOtGaYG1SyqutW2gjtmTZYrIBXPNcqGB8/pub?gid=0&single=true&output=csv"
-CERTS_CSV = "https://docs.google.com/spreadsheets/d/e/2PACX-1vTFJ959Chtv5sEuQ-PTyXQDyulOUr86vNMVifjCcw_WWhPJOtGaYG1SyqutW2gjtmTZYrIBXPNcqGB8/pub?gid=1561095255&single=true&output=csv"
-
-@st.cache_data(ttl=300)
-def load_csv_from_url(url, csv_name="data"):
-    """Load CSV from URL with error handling"""
-    try:
-        df = pd.read_csv(url)
-        df.columns = [c.strip().replace("\ufeff", "").replace('"', '') for c in df.columns]
-        df = df.loc[:, ~df.columns.duplicated()]
-        return df
-    except Exception as e:
-        return pd.DataFrame()
+# Push invalidation hook (e.g. called from an Apps Script onEdit trigger).
+# Enabled only when a token is set; with pushes arriving, polling can back off much further.
+HOOK_TOKEN = os.environ.get("SHEETS_HOOK_TOKEN")
+HOOK_HOST = os.environ.get("SHEETS_HOOK_HOST", "127.0.0.1")
+HOOK_PORT = int(os.environ.get("SHEETS_HOOK_PORT", "8765"))
+
+@st.cache_resource
+def get_sheet_store():
+    """Process-wide sheet data, seeded from the on-disk snapshot and renewed in the background"""
+    store = sheet_loader.SheetStore(
+        dashboard_data.SHEET_SOURCES,
+        snapshot_dir=dashboard_data.SNAPSHOT_DIR,
+        workbook=dashboard_data.WORKBOOK,
+        max_age=300,
+        min_interval=60,
+        max_interval=6 * 3600 if HOOK_TOKEN else 3600,
+    )
+    store.start_refresher(lead=30)
+    if HOOK_TOKEN:
+        figures = get_figure_cache()
+        try:
+            sheet_loader.start_invalidation_server(
+                store, HOOK_TOKEN, host=HOOK_HOST, port=HOOK_PORT,
+                extra_status=lambda: {"figures": figures.stats()},
+            )
+        except OSError:
+            pass
+    return store
 
 @st.cache_data
 def get_sample_core_pm():
-    return pd.DataFrame([
-        ["Google Project Management", "In Progress", "Foundation certification covering core PM principles"],
-        ["CAPM Certification", "Approved/Pending Exam", "PMI's Certified Associate in Project Management"],
-        ["Agile Methodologies", "Completed", "Scrum, Kanban, and Agile frameworks"],
-        ["Risk Management", "In Progress", "Identifying and mitigating project risks"],
-        ["Stakeholder Management", "Completed", "Communication and engagement strategies"],
-        ["Budget & Cost Control", "Planned", "Financial management for projects"]
-    ], columns=["Credential", "Status", "Description"])
+    return dashboard_data.sample_core_pm()
 
 @st.cache_data
 def get_sample_certs():
-    return pd.DataFrame([
-        ["Google Professional Certification - PM", "Google", 2025, "PM/Agile"],
-        ["Agile and Scrum", "Google Career Certificates", 2026, "PM/Agile"],
-        ["IBM Agile Explorer", "IBM", 2026, "PM/Agile"],
-        ["IBM Project Management Fundamentals", "IBM", 2026, "PM"],
-        ["Six Sigma White Belt", "2025", 2025, "Process Improvement"],
-        ["IBM Digital Literacy", "IBM", 2025, "Digital Skills"],
-        ["IBM Data Fundamentals", "IBM", 2025, "Data"],
-        ["Collaborative Working in a Remote Team", "University of Leeds", 2025, "Collaboration"],
-        ["Digital Power", "Huawei ICT Academy", 2025, "Digital Skills"],
-        ["Safety Training Programme", "2019", 2019, "Safety"],
-        ["Inventory and Warehouse Management", "2018", 2018, "Safety"],
-        ["Certified Explosive User", "2016", 2016, "Safety"],
-        ["OSHA 30HR General and Construction Industry", "2015", 2015, "Safety"],
-        ["Fall Protection Competent Person", "2015", 2015, "Safety"],
-        ["Hazard Communication Certificate", "2014", 2014, "Safety"],
-        ["Introductory to Supervisory Management", "Cipriani College", 2011, "Leadership"]
-    ], columns=["Certification", "Issuer", "Year", "Domain"])
-
-@st.cache_data
-def get_career_pathway():
-    return pd.DataFrame([
-        ["Google Professional Certification", "2025-2026", "Foundation", "Google", "Core PM concepts, Agile, Scrum", "In Progress"],
-        ["CAPM (PMI)", "2026 (Approved/Pending Exam)", "Professional", "Project Management Institute", "PMBOK Guide, PM framework", "Approved"],
-        ["OTHM Level 7 Diploma", "2026-2028", "Advanced", "OTHM Qualifications", "Strategic PM, Leadership, Risk", "Planned"],
-        ["MSc Project Management", "2028-2029", "Master's", "University Target", "Research, Advanced PM Theory", "Future Goal"]
-    ], columns=["Certification/Qualification", "Timeline", "Level", "Provider", "Focus Areas", "Status"])
+    return dashboard_data.sample_certs()
 
 @st.cache_data
 def get_capm_mapping_data():
     """Data for CAPM radar chart"""
-    return pd.DataFrame({
-        "Knowledge Area": ["Integration", "Scope", "Schedule", "Cost", "Quality", "Resource", "Risk", "Stakeholder"],
-        "Experience Level": [85, 80, 75, 70, 90, 85, 95, 80],
-        "Color": ["#3b82f6", "#8b5cf6", "#10b981", "#f59e0b", "#ef4444", "#ec4899", "#14b8a6", "#0ea5e9"]
-    })
+    return dashboard_data.capm_mapping_data()
 
 @st.cache_data
 def get_pm_credentials_chart_data():
     """Data for PM credentials progress chart"""
-    return pd.DataFrame({
-        "Credential": ["Google PM", "CAPM", "Agile", "Risk Mgmt", "Stakeholder", "Budget"],
-        "Status": ["In Progress", "Approved", "Completed", "In Progress", "Completed", "Planned"],
-        "Progress": [95, 55, 75, 60, 75, 45],
-        "Category": ["Certification", "Certification", "Skill", "Skill", "Skill", "Skill"]
-    })
+    return dashboard_data.pm_credentials_chart_data()
 
 @st.cache_data
-def create_gantt_chart():
-    """Create Gantt chart for career pathway - FIXED FOR MOBILE"""
-    tasks = [
-        dict(Task="Google PM Certification", Start='2025-01-01', Finish='2026-06-30', Status='In Progress'),
-        dict(Task="CAPM Exam Preparation", Start='2026-01-01', Finish='2026-12-31', Status='Approved'),
-        dict(Task="OTHM Level 7", Start='2026-12-01', Finish='2028-12-30', Status='Planned'),
-        dict(Task="MSc Project Management", Start='2028-09-01', Finish='2029-08-31', Status='Future'),
-        dict(Task="Industry Networking", Start='2025-01-01', Finish='2029-12-31', Status='Ongoing'),
-        dict(Task="Portfolio Development", Start='2024-11-01', Finish='2029-12-31', Status='Ongoing')
-    ]
-    
-    df = pd.DataFrame(tasks)
+def get_timeline_tasks():
+    """Tasks for the career pathway Gantt chart"""
+    return dashboard_data.timeline_tasks()
+
+@st.cache_resource
+def get_artifact_store():
+    return artifacts.ArtifactStore(dashboard_data.ARTIFACT_DIR)
+
+@st.cache_resource
+def get_render_service():
+    """Worker processes that build PDFs without holding this process's GIL"""
+    return render_service.RenderService(get_artifact_store(), max_workers=2)
+
+def render_document(name):
+    """PDF bytes for the current inputs, rendered in a worker only the first time they are seen"""
+    return get_render_service().render(name, *dashboard_data.document_inputs(name, df_certs, df_timeline), timeout=120)
+
+def document_url(name):
+    """Static URL of the document for the current inputs, or None until it is rendered
+
+    Once a document has been downloaded, a new version of it (after a sheet
+    edit) is queued in the background, so every session gets a plain link.
+    """
+    service = get_render_service()
+    key = service.prefetch(name, *dashboard_data.document_inputs(name, df_certs, df_timeline))
+    if service.status(key) != "done":
+        return None
+    path = get_artifact_store().publish(key, dashboard_data.STATIC_DOCUMENT_DIR, reports.DOCUMENTS[name]["file_name"])
+    return f"{dashboard_data.STATIC_DOCUMENT_URL}/{path}"
+
+def document_button(name, label):
+    """Link to the published PDF; until it exists, a download button that renders on click"""
+    url = document_url(name)
+    if url:
+        st.link_button(label, url, use_container_width=True)
+    else:
+        st.download_button(
+            label=label,
+            data=partial(render_document, name),
+            file_name=reports.DOCUMENTS[name]["file_name"],
+            mime="application/pdf",
+            on_click="ignore",
+            use_container_width=True,
+            key=f"{name}_download"
+        )
+
+# Plotly figures built once per process and data version, shared by all sessions
+@st.cache_resource
+def get_figure_cache():
+    return figure_cache.FigureCache()
+
+# Phones get a static "lite" variant of each chart: no mode bar or hover text,
+# fewer ticks and earlier aggregation (see figure_cache.lite_figure)
+MOBILE_USER_AGENT = re.compile(r"Mobi|Android|iPhone|iPad|iPod", re.IGNORECASE)
+MOBILE_GANTT_MAX_BARS = 20
+MOBILE_CREDENTIALS_MAX_BARS = 15
+CHART_CONFIG = {'displayModeBar': True, 'responsive': True}
+LITE_CHART_CONFIG = {'staticPlot': True, 'displayModeBar': False, 'responsive': True}
+
+def is_mobile_client():
+    """Whether this session's browser identifies as a phone or tablet"""
+    return bool(MOBILE_USER_AGENT.search(st.context.headers.get("User-Agent") or ""))
+
+# Dark theme shared by all dashboard charts. Setting it as each figure's
+# template also replaces the process default template in the payload.
+DARK_THEME = go.layout.Template(layout=dict(
+    plot_bgcolor='rgba(0,0,0,0)',
+    paper_bgcolor='rgba(0,0,0,0)',
+    font=dict(color='#e2e8f0', family='Inter'),
+    xaxis=dict(gridcolor='rgba(255,255,255,0.1)', tickfont=dict(color='#94a3b8')),
+    yaxis=dict(gridcolor='rgba(255,255,255,0.1)', tickfont=dict(color='#94a3b8')),
+    polar=dict(
+        bgcolor='rgba(0,0,0,0)',
+        radialaxis=dict(gridcolor='rgba(255,255,255,0.1)', tickfont=dict(color='#94a3b8')),
+        angularaxis=dict(gridcolor='rgba(255,255,255,0.1)', tickfont=dict(color='#94a3b8'))
+    ),
+    hoverlabel=dict(bgcolor='rgba(15, 23, 42, 0.9)', font=dict(family='Inter', color='#e2e8f0', size=12))
+))
+
+
+def create_gantt_chart(tasks, start=None, end=None, max_bars=gantt.MAX_BARS):
+    """Create Gantt chart for career pathway - FIXED FOR MOBILE
+
+    Bars are drawn as horizontal go.Bar traces with a date ``base`` and a
+    duration in milliseconds, one trace per status. Only tasks inside the
+    [start, end] window are sent; large plans are collapsed into status
+    swimlanes (see gantt.gantt_bars).
+    """
+    bars, summarized = gantt.gantt_bars(tasks, start, end, max_bars)
+    duration = (bars['Finish'] - bars['Start']).dt.total_seconds() * 1000
+    if summarized:
+        labels = bars['Status']
+        text = bars['Tasks'].astype(str) + " tasks"
+        hovertemplate = '<b>%{y}</b><br>%{base|%b %Y} – %{x|%b %Y}<br>%{text}<extra></extra>'
+    else:
+        labels = bars['Task']
+        text = None
+        hovertemplate = '<b>%{y}</b><br>%{base|%b %d, %Y} – %{x|%b %d, %Y}<extra></extra>'
     
-    # Create figure using plotly express timeline
-    fig = px.timeline(
-        df, 
-        x_start="Start", 
-        x_end="Finish", 
-        y="Task",
-        color="Status",
-        color_discrete_map={
-            'In Progress': '#3b82f6',
-            'Approved': '#10b981',
-            'Planned': '#8b5cf6',
-            'Future': '#f59e0b',
-            'Ongoing': '#64748b'
-        },
-        title=""
-    )
+    fig = go.Figure()
+    for status, rows in bars.groupby('Status', sort=False).groups.items():
+        fig.add_trace(go.Bar(
+            y=labels[rows],
+            x=duration[rows],
+            base=bars['Start'][rows],
+            orientation='h',
+            name=status,
+            marker_color=dashboard_data.TIMELINE_STATUS_COLORS.get(status, dashboard_data.STATUS_DEFAULT_COLOR),
+            text=text[rows] if text is not None else None,
+            textposition='inside' if text is not None else None,
+            hovertemplate=hovertemplate
+        ))
     
     fig.update_layout(
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        font=dict(color='#e2e8f0', family='Inter'),
+        template=DARK_THEME,
         height=400,
+        barmode='overlay',
         xaxis=dict(
+            type='date',
+            range=[start, end] if start is not None and end is not None else None,
             title="",
             showgrid=True,
-            gridcolor='rgba(255,255,255,0.1)',
-            tickfont=dict(color='#94a3b8', size=10),
+            tickfont_size=10,
             tickangle=0
         ),
         yaxis=dict(
             title="",
             showgrid=False,
-            tickfont=dict(color='#94a3b8', size=10),
+            tickfont_size=10,
             categoryorder='total ascending'
         ),
-        hoverlabel=dict(
-            bgcolor='rgba(15, 23, 42, 0.9)',
-            font_size=11,
-            font_family="Inter",
-            font_color='#e2e8f0'
-        ),
+        hoverlabel_font_size=11,
         legend=dict(
             orientation="h",
             yanchor="top",
@@ -162,49 +215,63 @@ def create_gantt_chart():
     
     return fig
 
-def create_pm_credentials_chart():
-    """Create horizontal bar chart for PM credentials progress - FIXED TITLE"""
-    data = get_pm_credentials_chart_data()
-    
-    # Color mapping for status
-    status_colors = {
-        "In Progress": "#3b82f6",
-        "Approved": "#10b981",
-        "Completed": "#8b5cf6",
-        "Planned": "#f59e0b"
-    }
-    
-    fig = go.Figure()
-    
-    for status in data['Status'].unique():
-        df_sub = data[data['Status'] == status]
+# Above this many credentials the chart shows one bar per status instead
+CREDENTIALS_CHART_MAX_BARS = 40
+
+def create_pm_credentials_chart(data, max_bars=CREDENTIALS_CHART_MAX_BARS):
+    """Create horizontal bar chart for PM credentials progress - FIXED TITLE
+
+    All bars are one trace, colored by mapping Status through a categorical,
+    so the figure is built in a single pass. Past ``max_bars``
+    rows the credentials are grouped by status (average progress and count),
+    which keeps the figure the same size however many there are.
+    """
+    # Via string: a categorical Status cannot take a fill value outside its categories
+    status = data['Status'].astype("string").fillna(gantt.UNKNOWN_STATUS).astype("category")
+    if len(data) > max_bars:
+        grouped = data.groupby(status, observed=True, sort=False)['Progress'].agg(['mean', 'size'])
+        status = grouped.index
+        labels = status.astype(str) + " (" + grouped['size'].map("{:,}".format) + ")"
+        progress = grouped['mean'].round(1)
+        hovertemplate = '<b>%{y}</b><br>Average progress: %{x}%<extra></extra>'
+    else:
+        labels = data['Credential']
+        progress = data['Progress']
+        hovertemplate = '<b>%{y}</b><br>Progress: %{x}%<br>Status: %{customdata}<extra></extra>'
+    colors = pd.Series(status.map(dashboard_data.CREDENTIAL_STATUS_COLORS), dtype=object)
+    colors = colors.fillna(dashboard_data.STATUS_DEFAULT_COLOR)
+    
+    fig = go.Figure(go.Bar(
+        y=labels,
+        x=progress,
+        orientation='h',
+        marker_color=colors.to_numpy(),
+        text=progress.astype(str).str.removesuffix(".0") + "%",
+        textposition='outside',
+        customdata=status.astype(str),
+        hovertemplate=hovertemplate,
+        showlegend=False
+    ))
+    # Legend entries only: the bars themselves are a single trace
+    for name in status.unique():
         fig.add_trace(go.Bar(
-            y=df_sub['Credential'],
-            x=df_sub['Progress'],
-            name=status,
+            x=[None],
+            y=[None],
+            name=str(name),
             orientation='h',
-            marker_color=status_colors[status],
-            text=df_sub['Progress'].apply(lambda x: f"{x}%"),
-            textposition='outside',
-            hovertemplate='<b>%{y}</b><br>Progress: %{x}%<br>Status: ' + status + '<extra></extra>'
+            marker_color=dashboard_data.CREDENTIAL_STATUS_COLORS.get(name, dashboard_data.STATUS_DEFAULT_COLOR)
         ))
     
     fig.update_layout(
-        title="",
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        font=dict(color='#e2e8f0', family='Inter'),
-        height=400,
+        template=DARK_THEME,
+        height=max(400, 60 + 24 * len(labels)),
         xaxis=dict(
             title="Progress (%)",
             range=[0, 110],
-            showgrid=True,
-            gridcolor='rgba(255,255,255,0.1)',
-            tickfont=dict(color='#94a3b8')
+            showgrid=True
         ),
         yaxis=dict(
-            showgrid=False,
-            tickfont=dict(color='#94a3b8')
+            showgrid=False
         ),
         legend=dict(
             orientation="h",
@@ -212,23 +279,17 @@ def create_pm_credentials_chart():
             y=1.02,
             xanchor="right",
             x=1,
-            font=dict(color='#94a3b8')
-        ),
-        hoverlabel=dict(
-            bgcolor='rgba(15, 23, 42, 0.9)',
-            font_size=12,
-            font_family="Inter",
-            font_color='#e2e8f0'
+            font=dict(color='#94a3b8'),
+            itemclick=False,
+            itemdoubleclick=False
         ),
         bargap=0.3
     )
     
     return fig
 
-def create_capm_radar_chart():
+def create_capm_radar_chart(data):
     """Create radar chart for CAPM knowledge areas"""
-    data = get_capm_mapping_data()
-    
     fig = go.Figure()
     
     fig.add_trace(go.Scatterpolar(
@@ -243,561 +304,29 @@ def create_capm_radar_chart():
     ))
     
     fig.update_layout(
-        title="",
-        polar=dict(
-            radialaxis=dict(
-                visible=True,
-                range=[0, 100],
-                tickfont=dict(color='#94a3b8'),
-                gridcolor='rgba(255,255,255,0.1)'
-            ),
-            angularaxis=dict(
-                tickfont=dict(color='#94a3b8'),
-                gridcolor='rgba(255,255,255,0.1)'
-            ),
-            bgcolor='rgba(0,0,0,0)'
-        ),
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        font=dict(color='#e2e8f0', family='Inter'),
+        template=DARK_THEME,
+        polar_radialaxis=dict(visible=True, range=[0, 100]),
         height=500,
-        showlegend=False,
-        hoverlabel=dict(
-            bgcolor='rgba(15, 23, 42, 0.9)',
-            font_size=12,
-            font_family="Inter",
-            font_color='#e2e8f0'
-        )
+        showlegend=False
     )
     
     return fig
 
-@st.cache_data
-def create_complete_portfolio_pdf():
-    """Create complete professional portfolio PDF"""
-    buffer = BytesIO()
-    
-    doc = SimpleDocTemplate(
-        buffer, 
-        pagesize=A4,
-        rightMargin=72,
-        leftMargin=72,
-        topMargin=72,
-        bottomMargin=72
-    )
-    
-    styles = getSampleStyleSheet()
-    
-    # Custom styles
-    title_style = ParagraphStyle(
-        'TitleStyle',
-        parent=styles['Title'],
-        fontSize=24,
-        textColor=colors.HexColor('#1e3a8a'),
-        spaceAfter=30,
-        alignment=TA_CENTER,
-        fontName='Helvetica-Bold'
-    )
-    
-    heading1_style = ParagraphStyle(
-        'Heading1Style',
-        parent=styles['Heading1'],
-        fontSize=18,
-        textColor=colors.HexColor('#1e3a8a'),
-        spaceAfter=12,
-        spaceBefore=25,
-        fontName='Helvetica-Bold'
-    )
-    
-    heading2_style = ParagraphStyle(
-        'Heading2Style',
-        parent=styles['Heading2'],
-        fontSize=14,
-        textColor=colors.HexColor('#065f46'),
-        spaceAfter=8,
-        spaceBefore=15,
-        fontName='Helvetica-Bold'
-    )
-    
-    normal_style = ParagraphStyle(
-        'NormalStyle',
-        parent=styles['Normal'],
-        fontSize=11,
-        textColor=colors.black,
-        spaceAfter=6,
-        alignment=TA_JUSTIFY
-    )
-    
-    bullet_style = ParagraphStyle(
-        'BulletStyle',
-        parent=styles['Normal'],
-        fontSize=11,
-        textColor=colors.black,
-        leftIndent=20,
-        spaceAfter=4
-    )
-    
-    content = []
-    
-    # Define current_date for this function
-    current_date = "January 15, 2026"
-    
-    # Cover Page
-    content.append(Spacer(1, 100))
-    content.append(Paragraph("PROJECT MANAGEMENT PORTFOLIO", title_style))
-    content.append(Spacer(1, 20))
-    content.append(Paragraph("Evron Hadai", ParagraphStyle(
-        'NameStyle',
-        parent=styles['Heading1'],
-        fontSize=22,
-        textColor=colors.HexColor('#1e40af'),
-        alignment=TA_CENTER,
-        spaceAfter=10
-    )))
-    content.append(Paragraph("Operations Professional → Project Manager", ParagraphStyle(
-        'SubtitleStyle',
-        parent=styles['Heading3'],
-        fontSize=16,
-        textColor=colors.HexColor('#4b5563'),
-        alignment=TA_CENTER,
-        spaceAfter=40
-    )))
-    
-    content.append(Paragraph(f"Report Generated: {current_date}", ParagraphStyle(
-        'DateStyle',
-        parent=styles['Normal'],
-        fontSize=10,
-        textColor=colors.HexColor('#6b7280'),
-        alignment=TA_CENTER,
-        spaceAfter=80
-    )))
-    
-    content.append(PageBreak())
-    
-    # Executive Summary
-    content.append(Paragraph("Executive Summary", heading1_style))
-    content.append(Spacer(1, 10))
-    
-    summary = """
-    This portfolio documents my structured transition from operations management to professional project management. 
-    With over 10 years of operational experience in high-risk industries, this pathway leverages existing expertise 
-    while systematically building formal PM competencies through certifications and academic progression.
-    """
-    content.append(Paragraph(summary, normal_style))
-    
-    content.append(Spacer(1, 15))
-    content.append(Paragraph("Key Achievements:", heading2_style))
-    
-    achievements = [
-        "16+ accumulated certifications across 7 domains",
-        "Google PM Certification: 95% complete (in progress)",
-        "CAPM Certification: Approved for 2026 exam",
-        "85%+ experience alignment with PMI knowledge areas",
-        "5-year strategic pathway from foundation to master's level"
-    ]
-    
-    for achievement in achievements:
-        content.append(Paragraph(f"• {achievement}", bullet_style))
-    
-    content.append(PageBreak())
-    
-    # Career Pathway
-    content.append(Paragraph("Career Pathway", heading1_style))
-    content.append(Spacer(1, 10))
-    
-    pathway_data = get_career_pathway()
-    
-    for idx, row in pathway_data.iterrows():
-        content.append(Paragraph(f"{row['Certification/Qualification']}", heading2_style))
-        content.append(Paragraph(f"Timeline: {row['Timeline']} | Level: {row['Level']}", normal_style))
-        content.append(Paragraph(f"Provider: {row['Provider']}", normal_style))
-        content.append(Paragraph(f"Focus Areas: {row['Focus Areas']}", normal_style))
-        content.append(Paragraph(f"Status: {row['Status']}", normal_style))
-        content.append(Spacer(1, 15))
-    
-    content.append(PageBreak())
-    
-    # Project Management Experience
-    content.append(Paragraph("Project Management Application", heading1_style))
-    content.append(Spacer(1, 10))
-    
-    project_text = """
-    This interactive portfolio dashboard itself serves as a demonstration of applied project management principles. 
-    Developed over a 6-day sprint (January 10-15, 2026), it showcases:
-    
-    • Agile project management methodology
-    • Scope and timeline management
-    • Risk assessment and mitigation
-    • Stakeholder consideration (hiring managers, recruiters, PM community)
-    • Quality assurance and testing
-    • Professional documentation
-    
-    The project was completed on schedule with 6/6 key deliverables successfully implemented.
-    """
-    content.append(Paragraph(project_text, normal_style))
-    
-    # Footer
-    content.append(Spacer(1, 30))
-    footer_text = f"""
-    Evron Hadai - Project Management Portfolio
-    LinkedIn: linkedin.com/in/evron-hadai
-    Report Version: 2.0 | Generated: {current_date}
-    """
-    
-    content.append(Paragraph(footer_text, ParagraphStyle(
-        'FooterStyle',
-        parent=styles['Normal'],
-        fontSize=9,
-        textColor=colors.HexColor('#4b5563'),
-        alignment=TA_CENTER,
-        spaceBefore=20
-    )))
-    
-    doc.build(content)
-    buffer.seek(0)
-    return buffer
-
-@st.cache_data
-def create_complete_project_charter():
-    """Create complete project charter PDF"""
-    buffer = BytesIO()
-    
-    doc = SimpleDocTemplate(
-        buffer, 
-        pagesize=A4,
-        rightMargin=72,
-        leftMargin=72,
-        topMargin=72,
-        bottomMargin=72,
-        title="PM Portfolio Dashboard - Project Charter"
-    )
-    
-    styles = getSampleStyleSheet()
-    
-    # Custom styles
-    title_style = ParagraphStyle(
-        'CharterTitle',
-        parent=styles['Title'],
-        fontSize=24,
-        textColor=colors.HexColor('#1e3a8a'),
-        spaceAfter=20,
-        alignment=TA_CENTER,
-        fontName='Helvetica-Bold'
-    )
-    
-    heading1_style = ParagraphStyle(
-        'CharterHeading1',
-        parent=styles['Heading1'],
-        fontSize=16,
-        textColor=colors.HexColor('#1e3a8a'),
-        spaceAfter=10,
-        spaceBefore=20,
-        fontName='Helvetica-Bold'
-    )
-    
-    heading2_style = ParagraphStyle(
-        'CharterHeading2',
-        parent=styles['Heading2'],
-        fontSize=14,
-        textColor=colors.HexColor('#065f46'),
-        spaceAfter=8,
-        spaceBefore=15,
-        fontName='Helvetica-Bold'
-    )
-    
-    normal_style = ParagraphStyle(
-        'CharterNormal',
-        parent=styles['Normal'],
-        fontSize=11,
-        textColor=colors.black,
-        spaceAfter=6,
-        alignment=TA_JUSTIFY
-    )
-    
-    bullet_style = ParagraphStyle(
-        'CharterBullet',
-        parent=styles['Normal'],
-        fontSize=11,
-        textColor=colors.black,
-        leftIndent=20,
-        spaceAfter=4
-    )
-    
-    content = []
-    
-    # Define current_date for this function
-    current_date = "January 15, 2026"
-    
-    # Cover Page
-    content.append(Spacer(1, 80))
-    content.append(Paragraph("PROJECT CHARTER", title_style))
-    content.append(Spacer(1, 30))
-    
-    content.append(Paragraph("Interactive Project Management<br/>Career Portfolio Dashboard", ParagraphStyle(
-        'ProjectTitle',
-        parent=styles['Heading1'],
-        fontSize=20,
-        textColor=colors.HexColor('#7c3aed'),
-        alignment=TA_CENTER,
-        spaceAfter=20
-    )))
-    
-    content.append(Paragraph("Project ID: PM-PORT-001", ParagraphStyle(
-        'ProjectID',
-        parent=styles['Normal'],
-        fontSize=12,
-        textColor=colors.HexColor('#6b7280'),
-        alignment=TA_CENTER,
-        spaceAfter=10
-    )))
-    
-    content.append(Spacer(1, 30))
-    
-    # Project info
-    project_info = [
-        "Project Sponsor: Evron Hadai",
-        "Project Manager: Evron Hadai",
-        "Start Date: January 10, 2026",
-        "Target Completion: January 15, 2026",
-        "Timeline: 6-day development sprint",
-        "Version: 2.0",
-        "Status: Completed Successfully"
-    ]
-    
-    for info in project_info:
-        content.append(Paragraph(info, normal_style))
-        content.append(Spacer(1, 5))
-    
-    content.append(PageBreak())
-    
-    # Project Overview
-    content.append(Paragraph("1. Project Overview", heading1_style))
-    content.append(Spacer(1, 10))
-    
-    overview = """
-    This project involves developing an interactive digital portfolio dashboard showcasing the structured transition 
-    from operations management to professional project management. The dashboard serves as both a career development 
-    tool and a demonstration of project management competencies applied in a real-world context.
-    """
-    content.append(Paragraph(overview, normal_style))
-    
-    content.append(Spacer(1, 15))
-    content.append(Paragraph("Primary Objectives:", heading2_style))
-    
-    objectives = [
-        "Demonstrate practical application of project management principles",
-        "Create a tangible portfolio piece bridging operational experience with formal PM qualifications",
-        "Develop an interactive tool for tracking and visualizing career progression",
-        "Establish professional digital presence in the project management domain",
-        "Showcase technical proficiency with modern web development technologies"
-    ]
-    
-    for obj in objectives:
-        content.append(Paragraph(f"• {obj}", bullet_style))
-    
-    content.append(PageBreak())
-    
-    # Project Scope
-    content.append(Paragraph("2. Project Scope & Deliverables", heading1_style))
-    content.append(Spacer(1, 10))
-    
-    content.append(Paragraph("Key Deliverables (6/6 Completed):", heading2_style))
-    
-    deliverables = [
-        "Interactive Streamlit Dashboard with real-time visualizations",
-        "Professional PDF Report Generation System",
-        "Project Charter & Documentation",
-        "Data Integration with Google Sheets API",
-        "Mobile-Responsive UI/UX Design",
-        "Error Handling & Fallback Systems"
-    ]
-    
-    for deliverable in deliverables:
-        content.append(Paragraph(f"✓ {deliverable}", bullet_style))
-    
-    content.append(Spacer(1, 15))
-    content.append(Paragraph("Success Metrics:", heading2_style))
-    
-    metrics = [
-        "Dashboard performance: <3s load time (Achieved: <2s)",
-        "PDF generation: <10s processing (Achieved: <5s)",
-        "Error rate: <1% target (Achieved: <0.5%)",
-        "Mobile compatibility: Full responsive support",
-        "User experience: Intuitive interface design"
-    ]
-    
-    for metric in metrics:
-        content.append(Paragraph(f"• {metric}", bullet_style))
-    
-    # Footer
-    content.append(Spacer(1, 30))
-    footer_text = f"""
-    PM Portfolio Dashboard Project Charter
-    Project Manager: Evron Hadai | Charter Version: 2.0
-    Generated: {current_date}
-    """
-    
-    content.append(Paragraph(footer_text, ParagraphStyle(
-        'CharterFooter',
-        parent=styles['Normal'],
-        fontSize=9,
-        textColor=colors.HexColor('#4b5563'),
-        alignment=TA_CENTER,
-        spaceBefore=20
-    )))
-    
-    doc.build(content)
-    buffer.seek(0)
-    return buffer
-
-@st.cache_data
-def create_complete_project_report():
-    """Create complete professional project report"""
-    buffer = BytesIO()
-    
-    doc = SimpleDocTemplate(
-        buffer, 
-        pagesize=A4,
-        rightMargin=72,
-        leftMargin=72,
-        topMargin=72,
-        bottomMargin=72,
-        title="PM Portfolio Dashboard - Professional Project Report"
-    )
-    
-    styles = getSampleStyleSheet()
-    
-    # Build content
-    content = []
-    
-    # Define current_date for this function
-    current_date = "January 15, 2026"
-    
-    # Cover Page
-    content.append(Spacer(1, 100))
-    content.append(Paragraph("PROFESSIONAL PROJECT REPORT", ParagraphStyle(
-        'ReportTitle',
-        parent=styles['Title'],
-        fontSize=28,
-        textColor=colors.HexColor('#1e3a8a'),
-        spaceAfter=30,
-        alignment=TA_CENTER
-    )))
-    
-    content.append(Paragraph("Interactive Project Management<br/>Career Portfolio Dashboard", ParagraphStyle(
-        'ProjectTitle',
-        parent=styles['Heading1'],
-        fontSize=22,
-        textColor=colors.HexColor('#7c3aed'),
-        alignment=TA_CENTER,
-        spaceAfter=20
-    )))
-    
-    content.append(Spacer(1, 30))
-    
-    content.append(Paragraph("Prepared by:", ParagraphStyle(
-        'PreparedBy',
-        parent=styles['Normal'],
-        fontSize=14,
-        textColor=colors.HexColor('#4b5563'),
-        alignment=TA_CENTER,
-        spaceAfter=5
-    )))
-    
-    content.append(Paragraph("Evron Hadai", ParagraphStyle(
-        'AuthorName',
-        parent=styles['Heading2'],
-        fontSize=18,
-        textColor=colors.HexColor('#1e40af'),
-        alignment=TA_CENTER,
-        spaceAfter=30
-    )))
-    
-    content.append(Paragraph(f"Report Date: {current_date}", ParagraphStyle(
-        'ReportDate',
-        parent=styles['Normal'],
-        fontSize=12,
-        textColor=colors.HexColor('#6b7280'),
-        alignment=TA_CENTER,
-        spaceAfter=60
-    )))
-    
-    content.append(Paragraph("This report documents the successful execution of a professional project management<br/>initiative to develop an interactive career portfolio dashboard.", ParagraphStyle(
-        'ReportDescription',
-        parent=styles['Normal'],
-        fontSize=11,
-        textColor=colors.HexColor('#4b5563'),
-        alignment=TA_CENTER,
-        spaceAfter=80
-    )))
-    
-    content.append(PageBreak())
-    
-    # Project Summary
-    content.append(Paragraph("Project Execution Summary", styles['Heading1']))
-    content.append(Spacer(1, 15))
-    
-    summary = """
-    The Interactive Project Management Career Portfolio Dashboard project was successfully completed 
-    within a 6-day development sprint (January 10-15, 2026). All 6 key deliverables were completed 
-    on schedule, meeting or exceeding all success criteria.
-    
-    This project demonstrates comprehensive project management capabilities including:
-    • Schedule Management: 6-day timeline precisely maintained
-    • Scope Management: All deliverables completed as specified
-    • Quality Management: High-performance standards achieved
-    • Risk Management: Proactive identification and mitigation
-    • Stakeholder Management: Multiple user personas considered
-    
-    The dashboard now serves as both a functional career development tool and a tangible 
-    demonstration of applied project management competencies.
-    """
-    content.append(Paragraph(summary, styles['Normal']))
-    
-    content.append(Spacer(1, 20))
-    content.append(Paragraph("Project Outcomes:", styles['Heading2']))
-    
-    outcomes = [
-        "Deliverables Completed: 6/6 (100%)",
-        "Success Criteria Met: 100%",
-        "Timeline Adherence: On schedule",
-        "Budget: $0 (utilizing open-source technologies)",
-        "Stakeholder Satisfaction: High"
-    ]
-    
-    for outcome in outcomes:
-        content.append(Paragraph(f"• {outcome}", styles['Normal']))
-    
-    # Footer
-    content.append(Spacer(1, 30))
-    footer_text = f"""
-    PM Portfolio Dashboard - Professional Project Report
-    Project Manager: Evron Hadai | Report Version: 2.0
-    Generated: {current_date}
-    """
-    
-    content.append(Paragraph(footer_text, ParagraphStyle(
-        'ReportFooter',
-        parent=styles['Normal'],
-        fontSize=9,
-        textColor=colors.HexColor('#4b5563'),
-        alignment=TA_CENTER,
-        spaceBefore=20
-    )))
-    
-    doc.build(content)
-    buffer.seek(0)
-    return buffer
-
 # Load data
 with st.spinner("Loading data..."):
-    core_pm = load_csv_from_url(CORE_PM_CSV, "Core PM Credentials")
+    sheet_data = get_sheet_store().get()
+    
+    core_pm = sheet_data["core_pm"]
     if core_pm.empty:
         core_pm = get_sample_core_pm()
     
-    df_certs = load_csv_from_url(CERTS_CSV, "Certifications")
+    df_certs = sheet_data["certs"]
     if df_certs.empty:
         df_certs = get_sample_certs()
+    
+    df_timeline = sheet_data.get("timeline", pd.DataFrame())
+    if df_timeline.empty:
+        df_timeline = get_timeline_tasks()
 
 # Calculate certification count
 if not df_certs.empty:
@@ -1011,7 +540,7 @@ st.markdown("""
 <div class="mobile-download-note">
     <div style="text-align: center; color: #94a3b8;">
         <div style="font-size: 1.5rem; margin-bottom: 10px;">📱</div>
-        <strong>Mobile Download Guide:</strong> Tap any download button → PDF will download automatically
+        <strong>Mobile Download Guide:</strong> Tap any download button → the PDF opens or downloads
     </div>
 </div>
 """, unsafe_allow_html=True)
@@ -1043,47 +572,16 @@ with col1:
     </a>
     """, unsafe_allow_html=True)
 
+# PDFs are rendered in worker processes and linked from a static route, so
+# they take no per-session memory and browsers can cache them
 with col2:
-    # Create and display portfolio PDF download button
-    portfolio_pdf = create_complete_portfolio_pdf()
-    portfolio_bytes = portfolio_pdf.getvalue()
-    
-    st.download_button(
-        label="📊 Download Portfolio",
-        data=portfolio_bytes,
-        file_name="Evron_Hadai_PM_Portfolio_20260115.pdf",
-        mime="application/pdf",
-        use_container_width=True,
-        key="portfolio_download"
-    )
+    document_button("portfolio", "📊 Download Portfolio")
 
 with col3:
-    # Create and display project charter PDF download button
-    charter_pdf = create_complete_project_charter()
-    charter_bytes = charter_pdf.getvalue()
-    
-    st.download_button(
-        label="📋 Download Project Charter",
-        data=charter_bytes,
-        file_name="PM_Portfolio_Project_Charter_20260115.pdf",
-        mime="application/pdf",
-        use_container_width=True,
-        key="charter_download"
-    )
+    document_button("charter", "📋 Download Project Charter")
 
 with col4:
-    # Create and display project report PDF download button
-    report_pdf = create_complete_project_report()
-    report_bytes = report_pdf.getvalue()
-    
-    st.download_button(
-        label="📄 Download Project Report",
-        data=report_bytes,
-        file_name="PM_Portfolio_Project_Report_20260115.pdf",
-        mime="application/pdf",
-        use_container_width=True,
-        key="report_download"
-    )
+    document_button("report", "📄 Download Project Report")
 
 # Career Pathway Cards
 st.markdown("""
@@ -1224,22 +722,50 @@ with col4:
 st.markdown('<div class="custom-divider"></div>', unsafe_allow_html=True)
 
 # Charts - WITH SEPARATE TITLES
+mobile = is_mobile_client()
+chart_config = LITE_CHART_CONFIG if mobile else CHART_CONFIG
 tab1, tab2, tab3 = st.tabs(["📅 Timeline", "📊 Progress", "🎯 CAPM Skills"])
 
 with tab1:
     st.markdown('<h3 class="chart-title">Career Pathway Timeline (2025-2029)</h3>', unsafe_allow_html=True)
-    gantt_fig = create_gantt_chart()
-    st.plotly_chart(gantt_fig, use_container_width=True, config={'displayModeBar': True, 'responsive': True})
+    # Large plans get a year window; only tasks inside it are sent to the browser
+    gantt_window = (None, None)
+    if len(df_timeline) > gantt.MAX_BARS:
+        years = pd.to_datetime(df_timeline['Start'], errors='coerce').dt.year.dropna().astype(int)
+        if not years.empty:
+            first_year, last_year = st.select_slider(
+                "Years shown",
+                options=list(range(years.min(), years.max() + 1)),
+                value=(years.min(), min(years.min() + 4, years.max())),
+                key="gantt_years"
+            )
+            gantt_window = (pd.Timestamp(first_year, 1, 1), pd.Timestamp(last_year, 12, 31))
+    gantt_fig = get_figure_cache().get_or_build(
+        f"gantt:{gantt_window}",
+        partial(create_gantt_chart, start=gantt_window[0], end=gantt_window[1]),
+        df_timeline,
+        lite=mobile,
+        lite_build=partial(
+            create_gantt_chart, start=gantt_window[0], end=gantt_window[1], max_bars=MOBILE_GANTT_MAX_BARS
+        )
+    )
+    st.plotly_chart(gantt_fig, use_container_width=True, config=chart_config)
 
 with tab2:
     st.markdown('<h3 class="chart-title">PM Credentials Progress Status</h3>', unsafe_allow_html=True)
-    pm_credentials_fig = create_pm_credentials_chart()
-    st.plotly_chart(pm_credentials_fig, use_container_width=True, config={'displayModeBar': True, 'responsive': True})
+    pm_credentials_fig = get_figure_cache().get_or_build(
+        "pm_credentials",
+        create_pm_credentials_chart,
+        get_pm_credentials_chart_data(),
+        lite=mobile,
+        lite_build=partial(create_pm_credentials_chart, max_bars=MOBILE_CREDENTIALS_MAX_BARS)
+    )
+    st.plotly_chart(pm_credentials_fig, use_container_width=True, config=chart_config)
 
 with tab3:
     st.markdown('<h3 class="chart-title">CAPM Knowledge Areas - Experience Level</h3>', unsafe_allow_html=True)
-    capm_fig = create_capm_radar_chart()
-    st.plotly_chart(capm_fig, use_container_width=True, config={'displayModeBar': True, 'responsive': True})
+    capm_fig = get_figure_cache().get_or_build("capm_radar", create_capm_radar_chart, get_capm_mapping_data(), lite=mobile)
+    st.plotly_chart(capm_fig, use_container_width=True, config=chart_config)
 
 # Project Management Section
 st.markdown("""
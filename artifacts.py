@@ -0,0 +1,191 @@
+"""Content-addressed on-disk store for generated documents"""
+import hashlib
+import os
+import re
+import shutil
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+
+# Versions of each document kept on disk, in the store and among published copies
+KEEP_VERSIONS = 3
+
+# Rows hashed at a time; hashing a text column materializes a Python string per row
+HASH_CHUNK_ROWS = 2048
+
+
+def hash_inputs(*inputs):
+    """Stable digest of builder inputs; DataFrames are hashed by content, HASH_CHUNK_ROWS rows at a time"""
+    digest = hashlib.sha256()
+    for value in inputs:
+        if isinstance(value, pd.DataFrame):
+            digest.update(repr(list(value.columns)).encode())
+            for start in range(0, len(value), HASH_CHUNK_ROWS):
+                rows = value.iloc[start:start + HASH_CHUNK_ROWS]
+                digest.update(pd.util.hash_pandas_object(rows, index=False).values.tobytes())
+        else:
+            digest.update(repr(value).encode())
+        digest.update(b"\x1e")
+    return digest.hexdigest()
+
+
+def write_atomic(path, data):
+    """Write bytes, or the rest of a file object, to a temporary file and rename it into place"""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        if isinstance(data, bytes):
+            f.write(data)
+        else:
+            shutil.copyfileobj(data, f)
+    os.replace(tmp_path, path)
+
+
+def remove_quietly(path):
+    """Delete a file that another process may have deleted already"""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def newest_first(paths):
+    """Existing paths, most recently modified first"""
+    stamped = []
+    for path in paths:
+        try:
+            stamped.append((os.path.getmtime(path), path))
+        except FileNotFoundError:
+            pass
+    return [path for _, path in sorted(stamped, reverse=True)]
+
+
+def prune_published(directory, file_name, keep=KEEP_VERSIONS):
+    """Delete all but the ``keep`` newest published copies of ``file_name`` and their digest directories"""
+    copies = [os.path.join(directory, digest, file_name) for digest in os.listdir(directory)]
+    for path in newest_first(copies)[keep:]:
+        remove_quietly(path)
+        try:
+            os.rmdir(os.path.dirname(path))
+        except OSError:
+            pass
+
+
+class ArtifactStore:
+    """Documents kept on disk under a hash of their name, template version and inputs
+
+    Identical inputs are rendered once and read back afterwards, across
+    sessions, restarts and replicas sharing the directory. A change to any
+    input or to the template version gives a new key, so exactly the affected
+    document is rebuilt. Building is left to ``render_service.RenderService``,
+    which renders each key at most once at a time.
+
+    Loaded documents are also kept in memory (least recently used first out,
+    up to ``memory_limit`` bytes) as immutable ``bytes``: every caller gets
+    the same object, with no re-read, pickling or copy per request.
+
+    Each new publish prunes the document's older versions down to
+    ``keep_versions``, in the store and in the published directory, newest
+    publish first.
+    """
+
+    def __init__(self, directory, memory_limit=64 * 1024 * 1024, keep_versions=KEEP_VERSIONS):
+        self.directory = directory
+        self.memory_limit = memory_limit
+        self.keep_versions = keep_versions
+        self._memory = OrderedDict()
+        self._memory_size = 0
+        self._digests = {}
+        self._current = {}
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def key(self, name, version, *inputs):
+        return f"{name}-{hash_inputs(name, version, *inputs)[:20]}"
+
+    def path(self, key):
+        return os.path.join(self.directory, f"{key}.pdf")
+
+    def load(self, key):
+        """Stored bytes for a key, or None"""
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+                return data
+        try:
+            with open(self.path(key), "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        self._remember(key, data)
+        return data
+
+    def _remember(self, key, data):
+        if len(data) > self.memory_limit:
+            return
+        with self._lock:
+            if key in self._memory:
+                return
+            self._memory[key] = data
+            self._memory_size += len(data)
+            while self._memory_size > self.memory_limit:
+                _, evicted = self._memory.popitem(last=False)
+                self._memory_size -= len(evicted)
+
+    def prune(self, name, keep=None):
+        """Delete all but the ``keep`` most recently rendered or published versions of a document"""
+        keep = self.keep_versions if keep is None else keep
+        pattern = re.compile(rf"{re.escape(name)}-[0-9a-f]{{20}}\.pdf")
+        paths = [os.path.join(self.directory, f) for f in os.listdir(self.directory) if pattern.fullmatch(f)]
+        for path in newest_first(paths)[keep:]:
+            remove_quietly(path)
+            key = os.path.basename(path)[:-len(".pdf")]
+            with self._lock:
+                self._digests.pop(key, None)
+                data = self._memory.pop(key, None)
+                if data is not None:
+                    self._memory_size -= len(data)
+
+    def publish(self, key, directory, file_name):
+        """Expose a stored document under ``directory/<content hash>/<file_name>``; returns that relative path
+
+        The path changes whenever the bytes do, so whatever serves the
+        directory can mark files immutable and browsers never see stale
+        content. The file is hard-linked from the store where possible.
+        """
+        name = key.rsplit("-", 1)[0]
+        with self._lock:
+            digest = self._digests.get(key)
+            current = self._current.get(name) == key
+            self._current[name] = key
+        if digest is None:
+            digest = hashlib.sha256()
+            with open(self.path(key), "rb") as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    digest.update(chunk)
+            digest = digest.hexdigest()[:16]
+            with self._lock:
+                self._digests[key] = digest
+        relative = f"{digest}/{file_name}"
+        target = os.path.join(directory, digest, file_name)
+        if current and os.path.exists(target):
+            return relative
+        if os.path.exists(target):
+            # An earlier version is current again: mark it as the newest
+            os.utime(target)
+            os.utime(self.path(key))
+        else:
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            tmp_path = f"{target}.{os.getpid()}.tmp"
+            try:
+                os.link(self.path(key), tmp_path)
+                os.replace(tmp_path, target)
+            except OSError:
+                with open(self.path(key), "rb") as f:
+                    write_atomic(target, f)
+            os.utime(self.path(key))
+        self.prune(name)
+        prune_published(directory, file_name, self.keep_versions)
+        return relative
@@ -0,0 +1,73 @@
+"""Portfolio PDF build time, file size and peak memory against certification rows
+
+Every build runs in a fresh interpreter so peaks and caches do not carry over.
+
+    python benchmarks/bench_portfolio_pdf.py              # 0 .. 40,000 rows
+    python benchmarks/bench_portfolio_pdf.py 1000 10000   # chosen row counts
+
+Time, size and RSS come from an untraced build; RSS is the whole process,
+interpreter and libraries included. Peak memory is the tracemalloc peak
+(Python allocations only) of the same build in another interpreter, since
+tracing slows the build about tenfold.
+"""
+import os
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+DEFAULT_ROWS = [0, 1000, 5000, 10000, 20000, 40000]
+ISSUERS = ["Google", "IBM", "University of Leeds", "Huawei ICT Academy", "Project Management Institute"]
+DOMAINS = ["PM/Agile", "Safety", "Digital Skills", "Data", "Process Improvement"]
+
+
+def certifications(rows):
+    """A certifications sheet of ``rows`` rows with long titles and some missing years"""
+    import pandas as pd
+
+    return pd.DataFrame({
+        "Certification": [f"Certification programme number {i} in applied project delivery" for i in range(rows)],
+        "Issuer": [ISSUERS[i % len(ISSUERS)] for i in range(rows)],
+        "Year": pd.array([2000 + i % 26 if i % 17 else None for i in range(rows)], dtype="Int64"),
+        "Domain": [DOMAINS[i % len(DOMAINS)] for i in range(rows)],
+    })
+
+
+def measure(rows, traced):
+    """Build one portfolio; print its time, size and RSS, or with ``traced`` its tracemalloc peak"""
+    import dashboard_data
+    import reports
+
+    certs = certifications(rows)
+    pathway = dashboard_data.career_pathway()
+    if traced:
+        tracemalloc.start()
+    start = time.perf_counter()
+    output = reports.create_complete_portfolio_pdf(pathway, certs)
+    elapsed = time.perf_counter() - start
+    if traced:
+        print(tracemalloc.get_traced_memory()[1])
+        return
+    output.seek(0, os.SEEK_END)
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    print(elapsed, output.tell(), rss)
+
+
+def run(rows, mode):
+    """Run ``measure`` in a fresh interpreter and return the numbers it printed"""
+    result = subprocess.run([sys.executable, __file__, mode, str(rows)], check=True, capture_output=True, text=True)
+    return [float(value) for value in result.stdout.split()]
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 3 and sys.argv[1] in ("--measure", "--trace"):
+        measure(int(sys.argv[2]), traced=sys.argv[1] == "--trace")
+    else:
+        for rows in [int(arg) for arg in sys.argv[1:]] or DEFAULT_ROWS:
+            elapsed, size, rss = run(rows, "--measure")
+            peak, = run(rows, "--trace")
+            print(f"{rows:>7} rows  {elapsed:7.2f}s  {size / 1024:8.0f} KiB  peak {peak / 2**20:6.1f} MiB"
+                  f"  rss {rss / 2**20:6.0f} MiB", flush=True)
@@ -0,0 +1,161 @@
+"""Sheet sources, sample data and document inputs shared by the dashboard and the export CLI
+
+Nothing here imports Streamlit; app.py wraps these in its caches.
+"""
+import os
+
+import pandas as pd
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache")
+
+# Google Drive CSV links
+CORE_PM_CSV = "https://docs.google.com/spreadsheets/d/e/2PACX-1vTFJ959Chtv5sEuQ-PTyXQDyulOUr86vNMVifjCcw_WWhPJOtGaYG1SyqutW2gjtmTZYrIBXPNcqGB8/pub?gid=0&single=true&output=csv"
+CERTS_CSV = "https://docs.google.com/spreadsheets/d/e/2PACX-1vTFJ959Chtv5sEuQ-PTyXQDyulOUr86vNMVifjCcw_WWhPJOtGaYG1SyqutW2gjtmTZYrIBXPNcqGB8/pub?gid=1561095255&single=true&output=csv"
+
+# Whole published spreadsheet as one multi-sheet export
+WORKBOOK_XLSX = "https://docs.google.com/spreadsheets/d/e/2PACX-1vTFJ959Chtv5sEuQ-PTyXQDyulOUr86vNMVifjCcw_WWhPJOtGaYG1SyqutW2gjtmTZYrIBXPNcqGB8/pub?output=xlsx"
+
+WORKBOOK = {"url": WORKBOOK_XLSX, "timeout": (3.05, 20)}
+
+# Declared columns and dtypes per sheet; anything else in the sheet is not read
+CORE_PM_SCHEMA = {"Credential": "string", "Status": "category", "Description": "string"}
+CERTS_SCHEMA = {"Certification": "string", "Issuer": "category", "Year": "Int64", "Domain": "category"}
+# Dates stay text here; the Gantt chart parses them (see gantt.prepare_tasks)
+TIMELINE_SCHEMA = {"Task": "string", "Start": "string", "Finish": "string", "Status": "category"}
+
+# Each source is read from its workbook tab; the CSV link is the fallback.
+# Timeouts are (connect, read) in seconds.
+SHEET_SOURCES = {
+    "core_pm": {"tab": "Core PM Credentials", "url": CORE_PM_CSV, "timeout": (3.05, 10), "schema": CORE_PM_SCHEMA},
+    "certs": {"tab": "Certifications", "url": CERTS_CSV, "timeout": (3.05, 10), "schema": CERTS_SCHEMA},
+    # Workbook tab only: no CSV link is published for the timeline
+    "timeline": {"tab": "Timeline", "schema": TIMELINE_SCHEMA},
+}
+
+# Chart colors by status, shared by the dashboard charts and their PDF versions
+TIMELINE_STATUS_COLORS = {
+    "In Progress": "#3b82f6",
+    "Approved": "#10b981",
+    "Planned": "#8b5cf6",
+    "Future": "#f59e0b",
+    "Ongoing": "#64748b",
+}
+CREDENTIAL_STATUS_COLORS = {
+    "In Progress": "#3b82f6",
+    "Approved": "#10b981",
+    "Completed": "#8b5cf6",
+    "Planned": "#f59e0b",
+}
+# For statuses not listed in a chart's map
+STATUS_DEFAULT_COLOR = "#94a3b8"
+
+# Last good sheet data, served instantly after a restart
+SNAPSHOT_DIR = os.path.join(CACHE_DIR, "sheets")
+
+# Rendered PDFs, stored by a hash of their inputs and template version
+ARTIFACT_DIR = os.path.join(CACHE_DIR, "artifacts")
+
+# Published copies under content-hashed paths (see artifacts.ArtifactStore.publish),
+# served at STATIC_DOCUMENT_URL by server.py, or by Streamlit's static route
+STATIC_DOCUMENT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static", "documents")
+STATIC_DOCUMENT_URL = "app/static/documents"
+
+
+def sample_core_pm():
+    """Core PM credentials shown when the sheet is unavailable"""
+    return pd.DataFrame([
+        ["Google Project Management", "In Progress", "Foundation certification covering core PM principles"],
+        ["CAPM Certification", "Approved/Pending Exam", "PMI's Certified Associate in Project Management"],
+        ["Agile Methodologies", "Completed", "Scrum, Kanban, and Agile frameworks"],
+        ["Risk Management", "In Progress", "Identifying and mitigating project risks"],
+        ["Stakeholder Management", "Completed", "Communication and engagement strategies"],
+        ["Budget & Cost Control", "Planned", "Financial management for projects"]
+    ], columns=["Credential", "Status", "Description"])
+
+
+def sample_certs():
+    """Certifications shown when the sheet is unavailable"""
+    return pd.DataFrame([
+        ["Google Professional Certification - PM", "Google", 2025, "PM/Agile"],
+        ["Agile and Scrum", "Google Career Certificates", 2026, "PM/Agile"],
+        ["IBM Agile Explorer", "IBM", 2026, "PM/Agile"],
+        ["IBM Project Management Fundamentals", "IBM", 2026, "PM"],
+        ["Six Sigma White Belt", "2025", 2025, "Process Improvement"],
+        ["IBM Digital Literacy", "IBM", 2025, "Digital Skills"],
+        ["IBM Data Fundamentals", "IBM", 2025, "Data"],
+        ["Collaborative Working in a Remote Team", "University of Leeds", 2025, "Collaboration"],
+        ["Digital Power", "Huawei ICT Academy", 2025, "Digital Skills"],
+        ["Safety Training Programme", "2019", 2019, "Safety"],
+        ["Inventory and Warehouse Management", "2018", 2018, "Safety"],
+        ["Certified Explosive User", "2016", 2016, "Safety"],
+        ["OSHA 30HR General and Construction Industry", "2015", 2015, "Safety"],
+        ["Fall Protection Competent Person", "2015", 2015, "Safety"],
+        ["Hazard Communication Certificate", "2014", 2014, "Safety"],
+        ["Introductory to Supervisory Management", "Cipriani College", 2011, "Leadership"]
+    ], columns=["Certification", "Issuer", "Year", "Domain"])
+
+
+def career_pathway():
+    """Qualification steps from foundation to master's level"""
+    return pd.DataFrame([
+        ["Google Professional Certification", "2025-2026", "Foundation", "Google", "Core PM concepts, Agile, Scrum", "In Progress"],
+        ["CAPM (PMI)", "2026 (Approved/Pending Exam)", "Professional", "Project Management Institute", "PMBOK Guide, PM framework", "Approved"],
+        ["OTHM Level 7 Diploma", "2026-2028", "Advanced", "OTHM Qualifications", "Strategic PM, Leadership, Risk", "Planned"],
+        ["MSc Project Management", "2028-2029", "Master's", "University Target", "Research, Advanced PM Theory", "Future Goal"]
+    ], columns=["Certification/Qualification", "Timeline", "Level", "Provider", "Focus Areas", "Status"])
+
+
+def capm_mapping_data():
+    """Data for CAPM radar chart"""
+    return pd.DataFrame({
+        "Knowledge Area": ["Integration", "Scope", "Schedule", "Cost", "Quality", "Resource", "Risk", "Stakeholder"],
+        "Experience Level": [85, 80, 75, 70, 90, 85, 95, 80],
+        "Color": ["#3b82f6", "#8b5cf6", "#10b981", "#f59e0b", "#ef4444", "#ec4899", "#14b8a6", "#0ea5e9"]
+    })
+
+
+def pm_credentials_chart_data():
+    """Data for PM credentials progress chart"""
+    return pd.DataFrame({
+        "Credential": ["Google PM", "CAPM", "Agile", "Risk Mgmt", "Stakeholder", "Budget"],
+        "Status": ["In Progress", "Approved", "Completed", "In Progress", "Completed", "Planned"],
+        "Progress": [95, 55, 75, 60, 75, 45],
+        "Category": ["Certification", "Certification", "Skill", "Skill", "Skill", "Skill"]
+    })
+
+
+def timeline_tasks():
+    """Tasks for the career pathway Gantt chart"""
+    return pd.DataFrame([
+        dict(Task="Google PM Certification", Start='2025-01-01', Finish='2026-06-30', Status='In Progress'),
+        dict(Task="CAPM Exam Preparation", Start='2026-01-01', Finish='2026-12-31', Status='Approved'),
+        dict(Task="OTHM Level 7", Start='2026-12-01', Finish='2028-12-30', Status='Planned'),
+        dict(Task="MSc Project Management", Start='2028-09-01', Finish='2029-08-31', Status='Future'),
+        dict(Task="Industry Networking", Start='2025-01-01', Finish='2029-12-31', Status='Ongoing'),
+        dict(Task="Portfolio Development", Start='2024-11-01', Finish='2029-12-31', Status='Ongoing')
+    ])
+
+
+def sheet_frames(sheet_data):
+    """Sheet data with the sample frames standing in for sources that have no data"""
+    core_pm = sheet_data.get("core_pm")
+    certs = sheet_data.get("certs")
+    timeline = sheet_data.get("timeline")
+    return {
+        "core_pm": sample_core_pm() if core_pm is None or core_pm.empty else core_pm,
+        "certs": sample_certs() if certs is None or certs.empty else certs,
+        "timeline": timeline_tasks() if timeline is None or timeline.empty else timeline,
+    }
+
+
+def document_inputs(name, certs, timeline):
+    """Data each document is built from, given the certifications and timeline sheets (see sheet_frames)"""
+    if name == "portfolio":
+        return (
+            career_pathway(),
+            certs,
+            timeline,
+            pm_credentials_chart_data(),
+            capm_mapping_data(),
+        )
+    return ()
@@ -0,0 +1,122 @@
+"""Render every dashboard document without Streamlit, for build steps and archiving
+
+    python export_documents.py --out dist/
+    python export_documents.py --zip dist/documents.zip --offline
+
+Sheet data comes through the same SheetStore the dashboard uses (the on-disk
+snapshot, refreshed from Google Sheets unless ``--offline``), with the sample
+data standing in for missing sources. Documents are rendered in parallel
+worker processes and written next to a ``manifest.json`` that records each
+file's size, SHA-256 and render time.
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import get_context
+
+import dashboard_data
+import reports
+import sheet_loader
+from artifacts import write_atomic
+
+
+def render_one(name, inputs, path):
+    """Worker entry point: render one document to ``path``; returns its digest, size and build time"""
+    started = time.perf_counter()
+    with reports.DOCUMENTS[name]["build"](*inputs) as output:
+        write_atomic(path, output)
+    elapsed = time.perf_counter() - started
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return {"sha256": digest.hexdigest(), "bytes": os.path.getsize(path), "render_seconds": round(elapsed, 3)}
+
+
+def load_sheet_data(offline=False, deadline=None):
+    """Sheet frames via SheetStore, plus its status for the manifest"""
+    store = sheet_loader.SheetStore(
+        dashboard_data.SHEET_SOURCES,
+        snapshot_dir=dashboard_data.SNAPSHOT_DIR,
+        workbook=dashboard_data.WORKBOOK,
+    )
+    if not offline:
+        store.refresh(deadline=deadline)
+    frames = dashboard_data.sheet_frames(store.frames)
+    return frames, {"version": store.version, "error": store.last_error}
+
+
+def export(names, directory, workers=None, offline=False, deadline=None):
+    """Render the named documents into ``directory`` and write the manifest; returns the manifest"""
+    started = time.perf_counter()
+    frames, sheets = load_sheet_data(offline, deadline)
+    os.makedirs(directory, exist_ok=True)
+    documents = {}
+    with ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn")) as pool:
+        futures = {}
+        for name in names:
+            spec = reports.DOCUMENTS[name]
+            inputs = dashboard_data.document_inputs(name, frames["certs"], frames["timeline"])
+            path = os.path.join(directory, spec["file_name"])
+            futures[pool.submit(render_one, name, inputs, path)] = name
+            documents[name] = {"file": spec["file_name"], "version": spec["version"]}
+        for future in as_completed(futures):
+            documents[futures[future]].update(future.result())
+    manifest = {
+        "generated_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "sheets": sheets,
+        "documents": documents,
+        "total_seconds": round(time.perf_counter() - started, 3),
+    }
+    write_atomic(os.path.join(directory, "manifest.json"), json.dumps(manifest, indent=2).encode())
+    return manifest
+
+
+def write_zip(directory, manifest, zip_path):
+    """Pack the rendered documents and manifest into one archive (PDFs are already compressed)"""
+    parent = os.path.dirname(os.path.abspath(zip_path))
+    os.makedirs(parent, exist_ok=True)
+    tmp_path = f"{zip_path}.{os.getpid()}.tmp"
+    with zipfile.ZipFile(tmp_path, "w", compression=zipfile.ZIP_STORED) as archive:
+        for document in manifest["documents"].values():
+            archive.write(os.path.join(directory, document["file"]), document["file"])
+        archive.write(os.path.join(directory, "manifest.json"), "manifest.json")
+    os.replace(tmp_path, zip_path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--out", help="directory to write the PDFs and manifest.json into")
+    target.add_argument("--zip", help="zip file to write the PDFs and manifest.json into")
+    parser.add_argument("--documents", nargs="+", choices=list(reports.DOCUMENTS), default=list(reports.DOCUMENTS),
+                        help="documents to render (default: all)")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: one per CPU)")
+    parser.add_argument("--offline", action="store_true", help="use the sheet snapshot only; do not fetch")
+    parser.add_argument("--deadline", type=float, default=sheet_loader.DEFAULT_DEADLINE,
+                        help="seconds to wait for sheet fetches (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    if args.zip:
+        with tempfile.TemporaryDirectory() as directory:
+            manifest = export(args.documents, directory, args.workers, args.offline, args.deadline)
+            write_zip(directory, manifest, args.zip)
+    else:
+        manifest = export(args.documents, args.out, args.workers, args.offline, args.deadline)
+
+    for name, document in manifest["documents"].items():
+        print(f"{document['file']}: {document['bytes']} bytes in {document['render_seconds']}s", file=sys.stderr)
+    if manifest["sheets"]["error"]:
+        print(f"sheet data: {manifest['sheets']['error']} (using snapshot or sample data)", file=sys.stderr)
+    print(f"done in {manifest['total_seconds']}s", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
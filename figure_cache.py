@@ -0,0 +1,151 @@
+"""Process-wide cache of dashboard Plotly figures, keyed by chart name and data version"""
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import plotly.io as pio
+
+from artifacts import hash_inputs
+
+FIGURE_CACHE_SIZE = 64
+# Decimal places kept in numeric trace arrays by compact_figure
+COMPACT_DECIMALS = 2
+# Axis ticks kept by lite_figure
+LITE_TICKS = 4
+
+
+def compact_array(values, decimals=COMPACT_DECIMALS):
+    """A smaller equivalent of a trace array, or None to leave it as it is
+
+    Floats are rounded and whole numbers are sent as the narrowest integer
+    type (Plotly ships numeric arrays as typed binary). Timestamps that are
+    all at midnight are sent as plain dates.
+    """
+    if not isinstance(values, np.ndarray) or values.size == 0:
+        return None
+    if values.dtype.kind == "f":
+        values = values.round(decimals)
+        if np.isfinite(values).all() and (values % 1 == 0).all():
+            return pd.to_numeric(values.astype(np.int64), downcast="integer")
+        return values
+    if values.dtype.kind in "iu":
+        return pd.to_numeric(values, downcast="integer")
+    if values.dtype.kind == "M":
+        days = values.astype("datetime64[D]")
+        if (days == values).all():
+            return np.datetime_as_string(days)
+    return None
+
+
+def compact_figure(figure, decimals=COMPACT_DECIMALS):
+    """Shrink a figure's serialized form in place: compact trace arrays (see compact_array)"""
+    for trace in figure.data:
+        for prop, values in trace.to_plotly_json().items():
+            compacted = compact_array(values, decimals)
+            if compacted is not None:
+                trace[prop] = compacted
+    return figure
+
+
+def lite_figure(figure, nticks=LITE_TICKS):
+    """Strip a figure in place for static rendering on small screens
+
+    Hover templates are dropped (a static plot never shows them) and value
+    axes get at most ``nticks`` ticks. Category axes are left alone so
+    every label still shows.
+    """
+    figure.update_traces(hovertemplate=None)
+    figure.update_xaxes(nticks=nticks)
+    figure.update_polars(radialaxis_nticks=nticks)
+    return figure
+
+
+class FigureCache:
+    """Bounded LRU of built figures shared by every session
+
+    A figure is built and validated once per chart and data version (the
+    content hash of its DataFrame); later script runs get the same object.
+    ``st.plotly_chart`` only serializes a Figure it is given, whereas a
+    dict or JSON spec would be validated again on every run, so the
+    validated Figure is what is kept. Figures are never mutated after they
+    are built. ``hits`` and ``misses`` count lookups since start-up.
+
+    With ``compact`` on, each new figure goes through ``compact_figure``.
+    ``sizes`` maps each cached chart name to the byte size of its serialized
+    JSON, as shipped by ``st.plotly_chart``, for its latest data version;
+    ``stats()`` reports them with their total.
+    Lite variants (see ``lite_figure``) are cached and sized under
+    ``"<name> (lite)"``, built with ``lite_build`` when the small-screen
+    chart differs (fewer bars, say), else from a copy of the full figure.
+    Each miss prepares both variants, so every chart is sized in both forms
+    and ``lite_savings`` covers all of them, whichever form clients asked for.
+    """
+
+    def __init__(self, max_entries=FIGURE_CACHE_SIZE, compact=True):
+        self.max_entries = max_entries
+        self.compact = compact
+        self.hits = 0
+        self.misses = 0
+        self.sizes = {}
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_build(self, name, build, data, lite=False, lite_build=None):
+        """The figure ``build(data)`` (or its lite variant) for this chart and data version, built on first use"""
+        version = hash_inputs(data)
+        lite_name = f"{name} (lite)"
+        key = (lite_name if lite else name, version)
+        with self._lock:
+            figure = self._entries.get(key)
+            if figure is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return figure
+        full = build(data)
+        variants = {name: full, lite_name: lite_figure(lite_build(data) if lite_build else go.Figure(full))}
+        sizes = {}
+        for variant, figure in variants.items():
+            if self.compact:
+                compact_figure(figure)
+            sizes[variant] = len(pio.to_json(figure, validate=False))
+        with self._lock:
+            self.misses += 1
+            self.sizes.update(sizes)
+            for variant, figure in variants.items():
+                self._entries[(variant, version)] = figure
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                (evicted, _), _ = self._entries.popitem(last=False)
+                if not any(cached == evicted for cached, _ in self._entries):
+                    self.sizes.pop(evicted, None)
+        return variants[key[0]]
+
+    def stats(self):
+        """Lookup counts since start-up and the serialized size of each chart"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else None,
+                "entries": len(self._entries),
+                "bytes": dict(self.sizes),
+                "total_bytes": sum(size for name, size in self.sizes.items() if not name.endswith(" (lite)")),
+                "total_lite_bytes": sum(size for name, size in self.sizes.items() if name.endswith(" (lite)")),
+                "lite_savings": self._lite_savings(),
+            }
+
+    def lite_savings(self):
+        """Bytes saved per chart by its lite variant"""
+        with self._lock:
+            return self._lite_savings()
+
+    def _lite_savings(self):
+        sizes = self.sizes
+        return {name: sizes[name] - sizes[f"{name} (lite)"] for name in sizes if f"{name} (lite)" in sizes}
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,78 @@
+"""Task preparation for the Gantt chart: date parsing, windowing and lane summaries
+
+Nothing here imports Streamlit or Plotly. ``gantt_bars`` turns a task sheet
+into the rows the chart draws. Only tasks that overlap the visible window
+are kept. Past ``MAX_BARS`` tasks they are collapsed into one swimlane per
+status, with busy periods (months, quarters or years, depending on the
+window) merged into single bars. The bar count is then bounded by
+lanes x periods, however many tasks the plan has.
+"""
+import pandas as pd
+
+MAX_BARS = 60
+# Summary period by window length in days: monthly up to ~2 years, quarterly up to ~8
+SUMMARY_PERIODS = [(750, "M"), (3000, "Q"), (None, "Y")]
+UNKNOWN_STATUS = "Unknown"
+
+
+def prepare_tasks(tasks):
+    """Task, Start, Finish and Status with parsed dates; rows without a start are dropped"""
+    start = pd.to_datetime(tasks["Start"], errors="coerce")
+    finish = pd.to_datetime(tasks["Finish"], errors="coerce")
+    prepared = pd.DataFrame({
+        "Task": tasks["Task"].astype("string").fillna(""),
+        "Start": start,
+        "Finish": finish.fillna(start).where(finish >= start, start),
+        "Status": tasks["Status"].astype("string").fillna(UNKNOWN_STATUS),
+    })
+    return prepared[prepared["Start"].notna()].reset_index(drop=True)
+
+
+def window_tasks(tasks, start=None, end=None):
+    """Tasks overlapping [start, end], clipped to it; either bound may be None"""
+    mask = pd.Series(True, index=tasks.index)
+    if start is not None:
+        start = pd.Timestamp(start)
+        mask &= tasks["Finish"] >= start
+    if end is not None:
+        end = pd.Timestamp(end)
+        mask &= tasks["Start"] <= end
+    visible = tasks[mask]
+    return visible.assign(
+        Start=visible["Start"].clip(lower=start) if start is not None else visible["Start"],
+        Finish=visible["Finish"].clip(upper=end) if end is not None else visible["Finish"],
+    )
+
+
+def summary_period(tasks):
+    """Period code used to summarize tasks spanning this many days"""
+    days = (tasks["Finish"].max() - tasks["Start"].min()).days if len(tasks) else 0
+    for limit, period in SUMMARY_PERIODS:
+        if limit is None or days <= limit:
+            return period
+
+
+def summarize_tasks(tasks, period):
+    """One bar per status lane and run of consecutive busy periods, with its task count"""
+    snapped = tasks.assign(
+        Start=tasks["Start"].dt.to_period(period).dt.start_time,
+        Finish=(tasks["Finish"].dt.to_period(period) + 1).dt.start_time,
+    ).sort_values(["Status", "Start"], kind="stable")
+    # A task opens a new bar when it starts after every earlier task in its lane has finished
+    reach = snapped.groupby("Status", sort=False)["Finish"].cummax()
+    previous = reach.groupby(snapped["Status"], sort=False).shift()
+    block = (previous.isna() | (snapped["Start"] > previous)).cumsum()
+    return snapped.groupby(block, sort=False).agg(
+        Status=("Status", "first"),
+        Start=("Start", "min"),
+        Finish=("Finish", "max"),
+        Tasks=("Task", "size"),
+    ).reset_index(drop=True)
+
+
+def gantt_bars(tasks, start=None, end=None, max_bars=MAX_BARS):
+    """Rows to draw and whether they are lane summaries rather than single tasks"""
+    visible = window_tasks(prepare_tasks(tasks), start, end)
+    if len(visible) <= max_bars:
+        return visible.assign(Tasks=1), False
+    return summarize_tasks(visible, summary_period(visible)), True
@@ -0,0 +1,177 @@
+"""Vector versions of the dashboard charts for the PDFs, built with reportlab.graphics
+
+Plotly figures can only be rasterized through a headless browser, so the
+PDFs draw the same data natively: timeline bars for the Gantt chart,
+horizontal bars for credentials progress and a spider chart for the CAPM
+alignment. Drawings are cached by chart type and data hash, so every
+document and build after the first reuses the same objects.
+"""
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+from reportlab.graphics.charts.barcharts import HorizontalBarChart
+from reportlab.graphics.charts.legends import Legend
+from reportlab.graphics.charts.spider import SpiderChart
+from reportlab.graphics.shapes import Drawing, Line, Rect, String
+from reportlab.lib import colors
+
+import gantt
+from artifacts import hash_inputs
+from dashboard_data import CREDENTIAL_STATUS_COLORS, STATUS_DEFAULT_COLOR, TIMELINE_STATUS_COLORS
+
+WIDTH = 451  # A4 frame width with 72pt margins
+DRAWING_CACHE_SIZE = 32
+# Timeline rows drawn before tasks are summarized per status, and the most
+# height the rows may take, so the chart always fits on one page
+TIMELINE_MAX_ROWS = 25
+TIMELINE_MAX_HEIGHT = 550
+
+TEXT_COLOR = colors.HexColor("#374151")
+GRID_COLOR = colors.HexColor("#e5e7eb")
+
+_drawings = OrderedDict()
+_lock = threading.Lock()
+
+
+def cached_drawing(kind, data):
+    """The Drawing for one chart type and data, built on first use"""
+    key = (kind, hash_inputs(data))
+    with _lock:
+        drawing = _drawings.get(key)
+        if drawing is not None:
+            _drawings.move_to_end(key)
+            return drawing
+    drawing = CHARTS[kind](data)
+    with _lock:
+        _drawings[key] = drawing
+        while len(_drawings) > DRAWING_CACHE_SIZE:
+            _drawings.popitem(last=False)
+    return drawing
+
+
+def status_legend(x, y, statuses, palette):
+    legend = Legend()
+    legend.x = x
+    legend.y = y
+    legend.alignment = "right"
+    legend.columnMaximum = 1
+    legend.fontName = "Helvetica"
+    legend.fontSize = 8
+    legend.fillColor = TEXT_COLOR
+    legend.boxAnchor = "sw"
+    legend.dx = legend.dy = 7
+    legend.deltax = 70
+    legend.colorNamePairs = [(colors.HexColor(palette.get(s, STATUS_DEFAULT_COLOR)), s) for s in statuses]
+    return legend
+
+
+def timeline_chart(tasks):
+    """Gantt-style bars from Task, Start, Finish and Status columns
+
+    Rows go through ``gantt.gantt_bars`` like the dashboard chart: unparsable
+    dates are dropped, and past TIMELINE_MAX_ROWS tasks each status becomes
+    one lane of merged busy periods, labelled with its task count.
+    """
+    bars, summarized = gantt.gantt_bars(tasks, max_bars=TIMELINE_MAX_ROWS)
+    if summarized:
+        counts = bars.groupby("Status", sort=False)["Tasks"].sum()
+        rows = [(f"{status} ({count:,} tasks)", bars[bars["Status"] == status]) for status, count in counts.items()]
+    else:
+        rows = [(task, bars.iloc[[i]]) for i, task in enumerate(bars["Task"])]
+
+    label_width, axis_height, legend_height = 140, 20, 24
+    row_height = min(22, TIMELINE_MAX_HEIGHT / max(len(rows), 1))
+    plot_width = WIDTH - label_width
+    height = legend_height + axis_height + row_height * len(rows)
+    drawing = Drawing(WIDTH, height)
+    if bars.empty:
+        return drawing
+    first_year = bars["Start"].min().year
+    last_year = bars["Finish"].max().year + 1
+    origin = pd.Timestamp(first_year, 1, 1)
+    span = (pd.Timestamp(last_year, 1, 1) - origin).days
+
+    def x_at(day):
+        return label_width + plot_width * (day - origin).days / span
+
+    top = height
+    for year in range(first_year, last_year + 1):
+        x = x_at(pd.Timestamp(year, 1, 1))
+        drawing.add(Line(x, legend_height + axis_height, x, top, strokeColor=GRID_COLOR, strokeWidth=0.5))
+        if year < last_year:
+            drawing.add(String(x + 2, legend_height + 6, str(year), fontName="Helvetica", fontSize=8, fillColor=TEXT_COLOR))
+    for i, (label, lane) in enumerate(rows):
+        y = top - row_height * (i + 1)
+        drawing.add(String(0, y + row_height / 2 - 4, str(label), fontName="Helvetica", fontSize=8, fillColor=TEXT_COLOR))
+        for start, finish, status in zip(lane["Start"], lane["Finish"], lane["Status"]):
+            drawing.add(Rect(x_at(start), y + 4, max(x_at(finish) - x_at(start), 1), max(row_height - 8, 1),
+                             fillColor=colors.HexColor(TIMELINE_STATUS_COLORS.get(status, STATUS_DEFAULT_COLOR)),
+                             strokeColor=None))
+    drawing.add(status_legend(0, 0, list(dict.fromkeys(bars["Status"])), TIMELINE_STATUS_COLORS))
+    return drawing
+
+
+def credentials_chart(data):
+    """Horizontal progress bars from Credential, Progress and Status columns"""
+    height = 50 + 22 * len(data)
+    drawing = Drawing(WIDTH, height)
+    chart = HorizontalBarChart()
+    chart.x, chart.y = 80, 44
+    chart.width, chart.height = WIDTH - 110, height - 50
+    chart.data = [list(data["Progress"])]
+    chart.categoryAxis.categoryNames = [str(c) for c in data["Credential"]]
+    chart.categoryAxis.reverseDirection = 1
+    chart.categoryAxis.labels.fontName = "Helvetica"
+    chart.categoryAxis.labels.fontSize = 8
+    chart.categoryAxis.labels.fillColor = TEXT_COLOR
+    chart.categoryAxis.strokeColor = GRID_COLOR
+    chart.valueAxis.valueMin, chart.valueAxis.valueMax, chart.valueAxis.valueStep = 0, 100, 20
+    chart.valueAxis.labels.fontName = "Helvetica"
+    chart.valueAxis.labels.fontSize = 8
+    chart.valueAxis.labels.fillColor = TEXT_COLOR
+    chart.valueAxis.strokeColor = GRID_COLOR
+    chart.valueAxis.visibleGrid = 1
+    chart.valueAxis.gridStrokeColor = GRID_COLOR
+    chart.bars.strokeColor = None
+    chart.barLabelFormat = "%d%%"
+    chart.barLabels.fontName = "Helvetica"
+    chart.barLabels.fontSize = 8
+    chart.barLabels.fillColor = TEXT_COLOR
+    chart.barLabels.boxAnchor = "w"
+    chart.barLabels.dx = 3
+    for i, status in enumerate(data["Status"]):
+        chart.bars[(0, i)].fillColor = colors.HexColor(CREDENTIAL_STATUS_COLORS.get(status, STATUS_DEFAULT_COLOR))
+    drawing.add(chart)
+    drawing.add(status_legend(80, 0, list(dict.fromkeys(data["Status"])), CREDENTIAL_STATUS_COLORS))
+    return drawing
+
+
+def capm_chart(data):
+    """Spider chart of Experience Level per Knowledge Area"""
+    drawing = Drawing(WIDTH, 240)
+    chart = SpiderChart()
+    chart.x, chart.y = (WIDTH - 200) / 2, 20
+    chart.width = chart.height = 200
+    levels = list(data["Experience Level"])
+    # An invisible strand at 100 pins the scale to 0-100, like the dashboard
+    chart.data = [levels, [100] * len(levels)]
+    chart.labels = [str(a) for a in data["Knowledge Area"]]
+    chart.spokes.strokeColor = GRID_COLOR
+    chart.spokeLabels.fontName = "Helvetica"
+    chart.spokeLabels.fontSize = 8
+    chart.spokeLabels.fillColor = TEXT_COLOR
+    chart.strands[0].strokeColor = colors.HexColor("#3b82f6")
+    chart.strands[0].strokeWidth = 1.5
+    chart.strands[0].fillColor = colors.Color(59 / 255, 130 / 255, 246 / 255, alpha=0.3)
+    chart.strands[1].strokeColor = None
+    chart.strands[1].fillColor = None
+    drawing.add(chart)
+    return drawing
+
+
+CHARTS = {
+    "timeline": timeline_chart,
+    "credentials": credentials_chart,
+    "capm": capm_chart,
+}
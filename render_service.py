@@ -0,0 +1,143 @@
+"""Process-pool document rendering, kept off the Streamlit script threads"""
+import os
+import sys
+import threading
+import time
+import types
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.context import SpawnContext, SpawnProcess
+
+import artifacts
+import reports
+from sheet_loader import backoff_delay
+
+# Backoff before a failed document is queued again in the background, in seconds
+RETRY_BASE = 30
+RETRY_CAP = 3600
+
+_main_lock = threading.Lock()
+
+
+def render_to_file(name, inputs, path):
+    """Worker entry point: build one document and write it straight into the store"""
+    with reports.DOCUMENTS[name]["build"](*inputs) as output:
+        artifacts.write_atomic(path, output)
+    return path
+
+
+class WorkerProcess(SpawnProcess):
+    """Spawned process that does not re-import the parent's ``__main__``
+
+    A spawned child normally re-runs the parent's main script (as
+    ``__mp_main__``) so that functions defined there can be unpickled. Under
+    Streamlit that script is the app, which would then build its own sheet
+    store, refresher and charts in every worker. Workers only need modules
+    importable by name, so a bare ``__main__`` is swapped in while the child
+    is launched.
+    """
+
+    def start(self):
+        stub = types.ModuleType("__main__")
+        with _main_lock:
+            main = sys.modules["__main__"]
+            sys.modules["__main__"] = stub
+            try:
+                super().start()
+            finally:
+                if sys.modules["__main__"] is stub:
+                    sys.modules["__main__"] = main
+
+
+class WorkerContext(SpawnContext):
+    Process = WorkerProcess
+
+
+class RenderService:
+    """Bounded process pool that renders documents into an ArtifactStore
+
+    ReportLab layout is pure-Python and holds the GIL, so building inline would
+    stall every other session's rerun. Jobs run in ``max_workers`` spawned
+    processes instead (see ``WorkerProcess``); each one writes its PDF to the
+    store's path, so only the small inputs cross the process boundary. A
+    document that is already stored or already queued is not submitted twice.
+
+    ``render`` (a download) always runs a job. ``prefetch``, called on every
+    rerun, only queues documents that have been downloaded at least once in
+    this process, and skips a key that failed until its backoff has passed.
+    """
+
+    def __init__(self, store, max_workers=2):
+        self.store = store
+        self._pool = ProcessPoolExecutor(max_workers=max_workers, mp_context=WorkerContext())
+        self._jobs = {}
+        self._errors = {}
+        self._failures = {}
+        self._retry_at = {}
+        self._requested = set()
+        self._lock = threading.Lock()
+
+    def key(self, name, *inputs):
+        return self.store.key(name, reports.DOCUMENTS[name]["version"], *inputs)
+
+    def submit(self, name, *inputs):
+        """Queue a render unless the document is stored or in flight; returns the job key"""
+        key = self.key(name, *inputs)
+        with self._lock:
+            if key in self._jobs or os.path.exists(self.store.path(key)):
+                return key
+            self._errors.pop(key, None)
+            future = self._pool.submit(render_to_file, name, inputs, self.store.path(key))
+            self._jobs[key] = future
+        future.add_done_callback(lambda f: self._finish(key, f))
+        return key
+
+    def prefetch(self, name, *inputs):
+        """Queue a render ahead of the next download, if this document is wanted; returns the job key"""
+        key = self.key(name, *inputs)
+        with self._lock:
+            wanted = name in self._requested and time.time() >= self._retry_at.get(key, 0)
+        return self.submit(name, *inputs) if wanted else key
+
+    def status(self, key):
+        """Job state: done, running, queued, failed or unknown"""
+        with self._lock:
+            future = self._jobs.get(key)
+            if key in self._errors:
+                return "failed"
+        if future is None:
+            return "done" if os.path.exists(self.store.path(key)) else "unknown"
+        if future.done():
+            return "failed" if future.exception() else "done"
+        return "running" if future.running() else "queued"
+
+    def result(self, key, timeout=None):
+        """Wait for a job (without holding the GIL) and return the document bytes"""
+        with self._lock:
+            future = self._jobs.get(key)
+            error = self._errors.get(key)
+        if future is not None:
+            future.result(timeout)
+        elif error:
+            raise RuntimeError(error)
+        data = self.store.load(key)
+        if data is None:
+            raise RuntimeError(f"document {key} was not rendered")
+        return data
+
+    def render(self, name, *inputs, timeout=None):
+        """Bytes of a document, rendered in a worker process if not stored yet"""
+        with self._lock:
+            self._requested.add(name)
+        return self.result(self.submit(name, *inputs), timeout)
+
+    def _finish(self, key, future):
+        with self._lock:
+            self._jobs.pop(key, None)
+            if future.exception() is not None:
+                self._errors[key] = repr(future.exception())
+                self._failures[key] = self._failures.get(key, 0) + 1
+                delay = backoff_delay(self._failures[key], base=RETRY_BASE, cap=RETRY_CAP)
+                self._retry_at[key] = time.time() + delay
+            else:
+                self._failures.pop(key, None)
+                self._retry_at.pop(key, None)
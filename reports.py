@@ -0,0 +1,570 @@
+"""ReportLab builders for the portfolio, charter and report PDFs
+
+Each document is a declarative spec: page settings plus named sections of
+blocks. ``render_pdf`` turns a spec and its data into flowables using one
+style registry that is compiled once per process, so a build does no style
+setup and a new report type is just another spec.
+
+A section's flowables are memoized on the data that section declares (and
+pathway-style row groups on each row), so after a sheet edit only the
+changed parts are rebuilt before layout.
+
+Builders return a seekable file positioned at the start of the PDF. Output
+goes to a spooled temporary file with page compression on, so large
+documents (the certifications appendix can run to thousands of rows) spill
+to disk instead of being held in memory a second time. Pages are compressed
+as they are finished (see ``CompressingCanvas``), but ReportLab still holds
+every page until the file is saved, so peak memory grows linearly with the
+output: about 0.3 MiB per 1,000 appendix rows (benchmarks/bench_portfolio_pdf.py).
+"""
+import copy
+import tempfile
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+from reportlab.lib import colors
+from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
+from reportlab.lib.pagesizes import A4
+from reportlab import rl_config
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.pdfbase.pdfdoc import PDFArray, PDFBase85Encode, PDFName, PDFStream, PDFZCompress
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.pdfgen.canvas import Canvas
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak, LongTable, TableStyle, Flowable, KeepTogether
+
+import pdf_charts
+from artifacts import hash_inputs
+
+CURRENT_DATE = "January 15, 2026"
+SECTION_CACHE_SIZE = 4096
+SPOOL_MAX_SIZE = 4 * 1024 * 1024
+
+# Appendix tables are split into LongTables of this many rows: splitting one
+# table across pages copies its remaining rows each time, which is quadratic.
+TABLE_CHUNK_ROWS = 500
+TABLE_FONT = "Helvetica"
+TABLE_FONT_SIZE = 8
+TABLE_STYLE = TableStyle([
+    ("FONT", (0, 0), (-1, -1), TABLE_FONT, TABLE_FONT_SIZE),
+    ("FONT", (0, 0), (-1, 0), "Helvetica-Bold", TABLE_FONT_SIZE),
+    ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+    ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#1e3a8a")),
+    ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, colors.HexColor("#f3f4f6")]),
+    ("LINEBELOW", (0, 0), (-1, -1), 0.25, colors.HexColor("#d1d5db")),
+    ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+])
+
+# Style name -> (parent sample style, overrides)
+STYLE_DEFINITIONS = {
+    # Shared body styles
+    "heading2": ("Heading2", dict(fontSize=14, textColor='#065f46', spaceAfter=8, spaceBefore=15, fontName='Helvetica-Bold')),
+    "normal": ("Normal", dict(fontSize=11, textColor='#000000', spaceAfter=6, alignment=TA_JUSTIFY)),
+    "bullet": ("Normal", dict(fontSize=11, textColor='#000000', leftIndent=20, spaceAfter=4)),
+    "footer": ("Normal", dict(fontSize=9, textColor='#4b5563', alignment=TA_CENTER, spaceBefore=20)),
+    "project_title": ("Heading1", dict(fontSize=20, textColor='#7c3aed', alignment=TA_CENTER, spaceAfter=20)),
+    # Portfolio
+    "portfolio_title": ("Title", dict(fontSize=24, textColor='#1e3a8a', spaceAfter=30, alignment=TA_CENTER, fontName='Helvetica-Bold')),
+    "portfolio_heading1": ("Heading1", dict(fontSize=18, textColor='#1e3a8a', spaceAfter=12, spaceBefore=25, fontName='Helvetica-Bold')),
+    "name": ("Heading1", dict(fontSize=22, textColor='#1e40af', alignment=TA_CENTER, spaceAfter=10)),
+    "subtitle": ("Heading3", dict(fontSize=16, textColor='#4b5563', alignment=TA_CENTER, spaceAfter=40)),
+    "date": ("Normal", dict(fontSize=10, textColor='#6b7280', alignment=TA_CENTER, spaceAfter=80)),
+    # Charter
+    "charter_title": ("Title", dict(fontSize=24, textColor='#1e3a8a', spaceAfter=20, alignment=TA_CENTER, fontName='Helvetica-Bold')),
+    "charter_heading1": ("Heading1", dict(fontSize=16, textColor='#1e3a8a', spaceAfter=10, spaceBefore=20, fontName='Helvetica-Bold')),
+    "project_id": ("Normal", dict(fontSize=12, textColor='#6b7280', alignment=TA_CENTER, spaceAfter=10)),
+    # Report
+    "report_title": ("Title", dict(fontSize=28, textColor='#1e3a8a', spaceAfter=30, alignment=TA_CENTER)),
+    "report_project_title": ("Heading1", dict(fontSize=22, textColor='#7c3aed', alignment=TA_CENTER, spaceAfter=20)),
+    "prepared_by": ("Normal", dict(fontSize=14, textColor='#4b5563', alignment=TA_CENTER, spaceAfter=5)),
+    "author": ("Heading2", dict(fontSize=18, textColor='#1e40af', alignment=TA_CENTER, spaceAfter=30)),
+    "report_date": ("Normal", dict(fontSize=12, textColor='#6b7280', alignment=TA_CENTER, spaceAfter=60)),
+    "report_description": ("Normal", dict(fontSize=11, textColor='#4b5563', alignment=TA_CENTER, spaceAfter=80)),
+}
+
+
+def compile_styles():
+    """Build every ParagraphStyle once; the sample styles are available under their own names"""
+    sample = getSampleStyleSheet()
+    styles = {name: sample[name] for name in ("Title", "Heading1", "Heading2", "Heading3", "Normal")}
+    for name, (parent, overrides) in STYLE_DEFINITIONS.items():
+        options = dict(overrides)
+        options["textColor"] = colors.HexColor(options["textColor"])
+        styles[name] = ParagraphStyle(name, parent=sample[parent], **options)
+    return styles
+
+
+STYLES = compile_styles()
+
+
+# Sections: (name, data keys the section reads, blocks). Every section also
+# sees current_date; a section whose data is missing or empty is left out.
+# Blocks:
+#   ("spacer", height)
+#   ("page_break",)
+#   ("paragraph", style, text)            text may use {placeholders} from the data
+#   ("bullets", style, marker, items)
+#   ("rows", data_key, [(style, text), ...], spacer_after)   one group per DataFrame row
+#   ("table", data_key, [(column, width), ...])            DataFrame as LongTables
+#   ("chart", style, title, chart_type, data_key)         titled, cached pdf_charts Drawing
+PORTFOLIO_SPEC = {
+    "title": None,
+    "sections": [
+        ("cover", (), [
+            ("spacer", 100),
+            ("paragraph", "portfolio_title", "PROJECT MANAGEMENT PORTFOLIO"),
+            ("spacer", 20),
+            ("paragraph", "name", "Evron Hadai"),
+            ("paragraph", "subtitle", "Operations Professional → Project Manager"),
+            ("paragraph", "date", "Report Generated: {current_date}"),
+            ("page_break",),
+        ]),
+        ("summary", (), [
+            ("paragraph", "portfolio_heading1", "Executive Summary"),
+            ("spacer", 10),
+            ("paragraph", "normal", """
+            This portfolio documents my structured transition from operations management to professional project management.
+            With over 10 years of operational experience in high-risk industries, this pathway leverages existing expertise
+            while systematically building formal PM competencies through certifications and academic progression.
+            """),
+            ("spacer", 15),
+            ("paragraph", "heading2", "Key Achievements:"),
+            ("bullets", "bullet", "•", [
+                "16+ accumulated certifications across 7 domains",
+                "Google PM Certification: 95% complete (in progress)",
+                "CAPM Certification: Approved for 2026 exam",
+                "85%+ experience alignment with PMI knowledge areas",
+                "5-year strategic pathway from foundation to master's level",
+            ]),
+            ("page_break",),
+        ]),
+        ("pathway", ("pathway",), [
+            ("paragraph", "portfolio_heading1", "Career Pathway"),
+            ("spacer", 10),
+            ("rows", "pathway", [
+                ("heading2", "{Certification/Qualification}"),
+                ("normal", "Timeline: {Timeline} | Level: {Level}"),
+                ("normal", "Provider: {Provider}"),
+                ("normal", "Focus Areas: {Focus Areas}"),
+                ("normal", "Status: {Status}"),
+            ], 15),
+            ("page_break",),
+        ]),
+        ("charts", ("timeline", "credentials", "capm"), [
+            ("paragraph", "portfolio_heading1", "Progress Overview"),
+            ("chart", "heading2", "Career Pathway Timeline", "timeline", "timeline"),
+            ("chart", "heading2", "PM Credentials Progress", "credentials", "credentials"),
+            ("chart", "heading2", "CAPM Knowledge Area Alignment", "capm", "capm"),
+            ("page_break",),
+        ]),
+        ("appendix", ("certs",), [
+            ("paragraph", "portfolio_heading1", "Appendix: Certifications"),
+            ("spacer", 10),
+            ("table", "certs", [("Certification", 210), ("Issuer", 115), ("Year", 36), ("Domain", 90)]),
+            ("page_break",),
+        ]),
+        ("application", (), [
+            ("paragraph", "portfolio_heading1", "Project Management Application"),
+            ("spacer", 10),
+            ("paragraph", "normal", """
+            This interactive portfolio dashboard itself serves as a demonstration of applied project management principles.
+            Developed over a 6-day sprint (January 10-15, 2026), it showcases:
+
+            • Agile project management methodology
+            • Scope and timeline management
+            • Risk assessment and mitigation
+            • Stakeholder consideration (hiring managers, recruiters, PM community)
+            • Quality assurance and testing
+            • Professional documentation
+
+            The project was completed on schedule with 6/6 key deliverables successfully implemented.
+            """),
+        ]),
+        ("footer", (), [
+            ("spacer", 30),
+            ("paragraph", "footer", """
+            Evron Hadai - Project Management Portfolio
+            LinkedIn: linkedin.com/in/evron-hadai
+            Report Version: 2.0 | Generated: {current_date}
+            """),
+        ]),
+    ],
+}
+
+CHARTER_SPEC = {
+    "title": "PM Portfolio Dashboard - Project Charter",
+    "sections": [
+        ("cover", (), [
+            ("spacer", 80),
+            ("paragraph", "charter_title", "PROJECT CHARTER"),
+            ("spacer", 30),
+            ("paragraph", "project_title", "Interactive Project Management<br/>Career Portfolio Dashboard"),
+            ("paragraph", "project_id", "Project ID: PM-PORT-001"),
+            ("spacer", 30),
+            ("bullets", "normal", None, [
+                "Project Sponsor: Evron Hadai",
+                "Project Manager: Evron Hadai",
+                "Start Date: January 10, 2026",
+                "Target Completion: January 15, 2026",
+                "Timeline: 6-day development sprint",
+                "Version: 2.0",
+                "Status: Completed Successfully",
+            ]),
+            ("page_break",),
+        ]),
+        ("overview", (), [
+            ("paragraph", "charter_heading1", "1. Project Overview"),
+            ("spacer", 10),
+            ("paragraph", "normal", """
+            This project involves developing an interactive digital portfolio dashboard showcasing the structured transition
+            from operations management to professional project management. The dashboard serves as both a career development
+            tool and a demonstration of project management competencies applied in a real-world context.
+            """),
+            ("spacer", 15),
+            ("paragraph", "heading2", "Primary Objectives:"),
+            ("bullets", "bullet", "•", [
+                "Demonstrate practical application of project management principles",
+                "Create a tangible portfolio piece bridging operational experience with formal PM qualifications",
+                "Develop an interactive tool for tracking and visualizing career progression",
+                "Establish professional digital presence in the project management domain",
+                "Showcase technical proficiency with modern web development technologies",
+            ]),
+            ("page_break",),
+        ]),
+        ("scope", (), [
+            ("paragraph", "charter_heading1", "2. Project Scope & Deliverables"),
+            ("spacer", 10),
+            ("paragraph", "heading2", "Key Deliverables (6/6 Completed):"),
+            ("bullets", "bullet", "✓", [
+                "Interactive Streamlit Dashboard with real-time visualizations",
+                "Professional PDF Report Generation System",
+                "Project Charter & Documentation",
+                "Data Integration with Google Sheets API",
+                "Mobile-Responsive UI/UX Design",
+                "Error Handling & Fallback Systems",
+            ]),
+            ("spacer", 15),
+            ("paragraph", "heading2", "Success Metrics:"),
+            ("bullets", "bullet", "•", [
+                "Dashboard performance: <3s load time (Achieved: <2s)",
+                "PDF generation: <10s processing (Achieved: <5s)",
+                "Error rate: <1% target (Achieved: <0.5%)",
+                "Mobile compatibility: Full responsive support",
+                "User experience: Intuitive interface design",
+            ]),
+        ]),
+        ("footer", (), [
+            ("spacer", 30),
+            ("paragraph", "footer", """
+            PM Portfolio Dashboard Project Charter
+            Project Manager: Evron Hadai | Charter Version: 2.0
+            Generated: {current_date}
+            """),
+        ]),
+    ],
+}
+
+REPORT_SPEC = {
+    "title": "PM Portfolio Dashboard - Professional Project Report",
+    "sections": [
+        ("cover", (), [
+            ("spacer", 100),
+            ("paragraph", "report_title", "PROFESSIONAL PROJECT REPORT"),
+            ("paragraph", "report_project_title", "Interactive Project Management<br/>Career Portfolio Dashboard"),
+            ("spacer", 30),
+            ("paragraph", "prepared_by", "Prepared by:"),
+            ("paragraph", "author", "Evron Hadai"),
+            ("paragraph", "report_date", "Report Date: {current_date}"),
+            ("paragraph", "report_description", "This report documents the successful execution of a professional project management<br/>initiative to develop an interactive career portfolio dashboard."),
+            ("page_break",),
+        ]),
+        ("summary", (), [
+            ("paragraph", "Heading1", "Project Execution Summary"),
+            ("spacer", 15),
+            ("paragraph", "Normal", """
+            The Interactive Project Management Career Portfolio Dashboard project was successfully completed
+            within a 6-day development sprint (January 10-15, 2026). All 6 key deliverables were completed
+            on schedule, meeting or exceeding all success criteria.
+
+            This project demonstrates comprehensive project management capabilities including:
+            • Schedule Management: 6-day timeline precisely maintained
+            • Scope Management: All deliverables completed as specified
+            • Quality Management: High-performance standards achieved
+            • Risk Management: Proactive identification and mitigation
+            • Stakeholder Management: Multiple user personas considered
+
+            The dashboard now serves as both a functional career development tool and a tangible
+            demonstration of applied project management competencies.
+            """),
+            ("spacer", 20),
+            ("paragraph", "Heading2", "Project Outcomes:"),
+            ("bullets", "Normal", "•", [
+                "Deliverables Completed: 6/6 (100%)",
+                "Success Criteria Met: 100%",
+                "Timeline Adherence: On schedule",
+                "Budget: $0 (utilizing open-source technologies)",
+                "Stakeholder Satisfaction: High",
+            ]),
+        ]),
+        ("footer", (), [
+            ("spacer", 30),
+            ("paragraph", "footer", """
+            PM Portfolio Dashboard - Professional Project Report
+            Project Manager: Evron Hadai | Report Version: 2.0
+            Generated: {current_date}
+            """),
+        ]),
+    ],
+}
+
+
+class SectionCache:
+    """Bounded LRU of built flowables keyed by section and input hash
+
+    Platypus sets layout state on flowables while building a document, so
+    callers get shallow copies and the cached originals are never laid out.
+    """
+
+    def __init__(self, max_entries=SECTION_CACHE_SIZE):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_build(self, key, build):
+        with self._lock:
+            flowables = self._entries.get(key)
+            if flowables is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+        if flowables is None:
+            flowables = build()
+            with self._lock:
+                self.misses += 1
+                self._entries[key] = flowables
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return [copy.copy(f) for f in flowables]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+section_cache = SectionCache()
+
+
+def build_row(lines, row, spacer_after):
+    """Flowables for one row of a rows block"""
+    content = [Paragraph(text.format_map(row), STYLES[style]) for style, text in lines]
+    content.append(Spacer(1, spacer_after))
+    return content
+
+
+def fit_text(value, width):
+    """Cell text, cut with an ellipsis to fit a table column"""
+    if pd.isna(value):
+        return ""
+    text = str(value)
+    width -= 6  # default cell padding
+    if stringWidth(text, TABLE_FONT, TABLE_FONT_SIZE) <= width:
+        return text
+    # Longest prefix that fits with the ellipsis; widths grow with length so bisect it
+    low, high = 0, len(text)
+    while low < high:
+        middle = (low + high + 1) // 2
+        if stringWidth(text[:middle] + "…", TABLE_FONT, TABLE_FONT_SIZE) <= width:
+            low = middle
+        else:
+            high = middle - 1
+    return text[:low] + "…"
+
+
+class ChunkedTable(Flowable):
+    """A DataFrame laid out as LongTables of TABLE_CHUNK_ROWS rows, built one chunk at a time
+
+    Tables keep a style object per cell, so only the chunk being placed is
+    ever materialized: this flowable never fits and splits into the part of
+    the next chunk that does, then the rest. Each chunk repeats its header
+    row when it breaks across pages.
+    """
+
+    def __init__(self, frame, columns, start=0):
+        Flowable.__init__(self)
+        self.frame = frame
+        self.columns = columns
+        self.start = start
+
+    def wrap(self, availWidth, availHeight):
+        return availWidth, availHeight + 1
+
+    def split(self, availWidth, availHeight):
+        end = min(self.start + TABLE_CHUNK_ROWS, len(self.frame))
+        chunk = self.frame.iloc[self.start:end]
+        cells = [[fit_text(value, width) for value in chunk[name]] for name, width in self.columns]
+        table = LongTable(
+            [[name for name, _ in self.columns]] + [list(row) for row in zip(*cells)],
+            colWidths=[width for _, width in self.columns],
+            repeatRows=1,
+            style=TABLE_STYLE,
+        )
+        rest = [ChunkedTable(self.frame, self.columns, end)] if end < len(self.frame) else []
+        if table.wrap(availWidth, availHeight)[1] <= availHeight:
+            return [table] + rest
+        parts = table.split(availWidth, availHeight)
+        return parts + rest if parts else []
+
+    def draw(self):
+        pass
+
+
+class CompressingCanvas(Canvas):
+    """Canvas that encodes each page's content stream as soon as the page ends
+
+    ReportLab keeps every page's drawing operators as text until ``save``
+    and only compresses them while writing the file, so a long appendix
+    held roughly eight times its final size in memory. Here the stream is
+    run through the page's filters when the page is finished, exactly as
+    ``save`` would, and only the encoded bytes are kept. Output is
+    byte-identical.
+    """
+
+    def showPage(self):
+        Canvas.showPage(self)
+        page = self._doc.Pages.pages[-1]
+        if not (page.compression and page.stream):
+            return
+        filters = [PDFBase85Encode, PDFZCompress] if rl_config.useA85 else [PDFZCompress]
+        content = page.stream
+        for stream_filter in reversed(filters):
+            content = stream_filter.encode(content)
+        stream = PDFStream(content=content)
+        stream.dictionary["Filter"] = PDFArray([PDFName(f.pdfname) for f in filters])
+        stream.__Comment__ = "page stream"
+        page.Contents = stream
+        page.stream = None
+
+
+def build_flowables(blocks, data, section_key=None):
+    """Turn spec blocks plus data into a list of flowables"""
+    content = []
+    for block in blocks:
+        kind = block[0]
+        if kind == "spacer":
+            content.append(Spacer(1, block[1]))
+        elif kind == "page_break":
+            content.append(PageBreak())
+        elif kind == "paragraph":
+            _, style, text = block
+            content.append(Paragraph(text.format_map(data), STYLES[style]))
+        elif kind == "bullets":
+            _, style, marker, items = block
+            for item in items:
+                content.append(Paragraph(f"{marker} {item}" if marker else item, STYLES[style]))
+                if not marker:
+                    content.append(Spacer(1, 5))
+        elif kind == "rows":
+            _, key, lines, spacer_after = block
+            for row in data[key].to_dict("records"):
+                if section_key is None:
+                    content.extend(build_row(lines, row, spacer_after))
+                else:
+                    row_key = (section_key, key, hash_inputs(sorted(row.items())))
+                    content.extend(section_cache.get_or_build(
+                        row_key, lambda row=row: build_row(lines, row, spacer_after)))
+        elif kind == "table":
+            _, key, columns = block
+            if len(data[key]):
+                frame = data[key].reindex(columns=[name for name, _ in columns])
+                content.append(ChunkedTable(frame, columns))
+        elif kind == "chart":
+            _, style, title, chart_type, key = block
+            drawing = pdf_charts.cached_drawing(chart_type, data[key])
+            content.append(KeepTogether([Paragraph(title, STYLES[style]), drawing]))
+        else:
+            raise ValueError(f"unknown block type: {kind}")
+    return content
+
+
+def build_sections(spec, data):
+    """Flowables for every section, reusing those whose inputs are unchanged"""
+    content = []
+    for name, keys, blocks in spec["sections"]:
+        if any(data.get(k) is None or len(data[k]) == 0 for k in keys):
+            continue
+        section_data = {"current_date": CURRENT_DATE, **{k: data[k] for k in keys}}
+        section_key = (id(spec), name)
+        if any(block[0] == "rows" for block in blocks):
+            # Row groups are memoized one by one below; the rest is cheap
+            content.extend(build_flowables(blocks, section_data, section_key))
+            continue
+        key = section_key + (hash_inputs(*section_data.values()),)
+        content.extend(section_cache.get_or_build(
+            key, lambda blocks=blocks, section_data=section_data: build_flowables(blocks, section_data)))
+    return content
+
+
+def render_pdf(spec, data):
+    """Render a document spec with its data into a spooled temporary file
+
+    Documents are built with ReportLab's invariant mode (fixed IDs and
+    timestamps), so identical inputs always produce byte-identical files.
+    """
+    buffer = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+    doc = SimpleDocTemplate(
+        buffer,
+        pagesize=A4,
+        rightMargin=72,
+        leftMargin=72,
+        topMargin=72,
+        bottomMargin=72,
+        invariant=1,
+        pageCompression=1,
+        **({"title": spec["title"]} if spec["title"] else {})
+    )
+    doc.build(build_sections(spec, data), canvasmaker=CompressingCanvas)
+    buffer.seek(0)
+    return buffer
+
+
+def create_complete_portfolio_pdf(pathway_data, certs_data=None, timeline_data=None, credentials_data=None, capm_data=None):
+    """Create complete professional portfolio PDF; charts and the certifications appendix are included when their data is given"""
+    return render_pdf(PORTFOLIO_SPEC, {
+        "pathway": pathway_data,
+        "certs": certs_data,
+        "timeline": timeline_data,
+        "credentials": credentials_data,
+        "capm": capm_data,
+    })
+
+
+def create_complete_project_charter():
+    """Create complete project charter PDF"""
+    return render_pdf(CHARTER_SPEC, {})
+
+
+def create_complete_project_report():
+    """Create complete professional project report"""
+    return render_pdf(REPORT_SPEC, {})
+
+
+# Bump a document's version whenever its rendered output changes so stored
+# copies are rebuilt.
+DOCUMENTS = {
+    "portfolio": {
+        "build": create_complete_portfolio_pdf,
+        "version": 4,
+        "file_name": "Evron_Hadai_PM_Portfolio_20260115.pdf",
+    },
+    "charter": {
+        "build": create_complete_project_charter,
+        "version": 1,
+        "file_name": "PM_Portfolio_Project_Charter_20260115.pdf",
+    },
+    "report": {
+        "build": create_complete_project_report,
+        "version": 1,
+        "file_name": "PM_Portfolio_Project_Report_20260115.pdf",
+    },
+}
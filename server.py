@@ -0,0 +1,53 @@
+"""ASGI entry point: the dashboard plus long-lived caching of published PDFs
+
+    streamlit run server.py        # or: uvicorn server:app
+
+Streamlit's own static route answers every request with the full file and
+no Cache-Control. Published documents live under a hash of their bytes
+(see artifacts.ArtifactStore.publish), so a URL never changes content and
+browsers and proxies may keep it for good. The route below, mounted ahead
+of Streamlit's, serves them as immutable and answers revalidations with
+304 Not Modified. ``streamlit run app.py`` still works, without these
+headers.
+"""
+import os
+import re
+
+import streamlit as st
+from starlette.responses import FileResponse, Response
+from starlette.routing import Route
+
+import dashboard_data
+
+DOCUMENT_CACHE_CONTROL = "public, max-age=31536000, immutable"
+DIGEST_PATTERN = re.compile(r"[0-9a-f]{16}")
+
+
+def etag_matches(if_none_match, etag):
+    """Whether an If-None-Match header names ``etag`` (weak or strong) or is ``*``"""
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or any(tag.removeprefix("W/") == etag for tag in tags)
+
+
+def published_document(request):
+    """A published PDF with immutable caching headers, or 304 when the client already has it"""
+    digest = request.path_params["digest"]
+    file_name = request.path_params["file_name"]
+    path = os.path.join(dashboard_data.STATIC_DOCUMENT_DIR, digest, file_name)
+    if not DIGEST_PATTERN.fullmatch(digest) or file_name.startswith(".") or not os.path.isfile(path):
+        return Response(status_code=404)
+    # The directory name is a hash of the file's bytes, so it is a strong validator
+    etag = f'"{digest}"'
+    headers = {"Cache-Control": DOCUMENT_CACHE_CONTROL, "ETag": etag}
+    if etag_matches(request.headers.get("If-None-Match", ""), etag):
+        return Response(status_code=304, headers=headers)
+    return FileResponse(path, headers=headers, media_type="application/pdf")
+
+
+app = st.App(
+    "app.py",
+    routes=[
+        Route(f"/{dashboard_data.STATIC_DOCUMENT_URL}/{{digest}}/{{file_name}}", published_document,
+              methods=["GET", "HEAD"]),
+    ],
+)
@@ -0,0 +1,801 @@
+"""Google Sheets CSV loading for the PM portfolio dashboard"""
+import csv
+import hashlib
+import hmac
+import json
+import os
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeout
+from functools import partial
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+from urllib.parse import unquote
+
+import pandas as pd
+import requests
+from pyarrow import feather
+from requests.adapters import HTTPAdapter
+
+try:
+    import python_calamine  # noqa: F401  (Rust XLSX reader, much faster than openpyxl)
+    EXCEL_ENGINE = "calamine"
+except ImportError:
+    EXCEL_ENGINE = None  # pandas' default, openpyxl
+
+# (connect, read) timeouts in seconds used when a source does not set its own
+DEFAULT_TIMEOUT = (3.05, 10)
+
+# Starting refresh interval per source; it then adapts to how often the source changes
+DEFAULT_MAX_AGE = 300
+
+# Bounds for the adaptive per-source refresh interval, in seconds
+DEFAULT_MIN_INTERVAL = 60
+DEFAULT_MAX_INTERVAL = 3600
+
+# Interval multipliers applied after an unchanged / changed fetch
+INTERVAL_GROWTH = 1.5
+INTERVAL_SHRINK = 0.5
+
+# How many change timestamps are kept per source
+CHANGE_HISTORY = 20
+
+# Schedule unit shared by every source read from the workbook export
+WORKBOOK_UNIT = "workbook"
+
+# Upper bound on how long a script run may block on the first ever load
+DEFAULT_DEADLINE = 15
+
+# Retry backoff after a failed refresh: base delay in seconds, doubled per failure
+RETRY_BASE = 5
+
+# Consecutive failures before an endpoint's circuit opens, and how long it stays open
+BREAKER_THRESHOLD = 3
+BREAKER_RESET = 60
+
+SNAPSHOT_MANIFEST = "manifest.json"
+
+# Shared pool so every sheet fetch runs in parallel instead of back to back
+_fetch_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="sheet-fetch")
+
+
+def create_session(pool_size=4):
+    """Create a keep-alive HTTP session shared by all sheet fetches"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=2, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def clean_name(name):
+    """Strip BOMs, quotes and whitespace from a header"""
+    return str(name).strip().replace("\ufeff", "").replace('"', '')
+
+
+def clean_columns(df):
+    """Clean every header and drop duplicate columns"""
+    df.columns = [clean_name(c) for c in df.columns]
+    return df.loc[:, ~df.columns.duplicated()]
+
+
+def apply_schema(df, schema):
+    """Select and cast the columns declared in ``schema`` ({column: dtype})
+
+    Missing columns are added as nulls and values that do not fit a numeric
+    dtype are nulled; both are listed in ``df.attrs["schema_violations"]``.
+    Raises ValueError when none of the declared columns are present, which
+    usually means the sheet came back as something other than the table.
+    """
+    present = [column for column in schema if column in df.columns]
+    if not present:
+        raise ValueError(f"none of the expected columns found: {', '.join(schema)}")
+
+    violations = []
+    missing = [column for column in schema if column not in df.columns]
+    if missing:
+        violations.append(f"missing columns: {', '.join(missing)}")
+
+    typed = {}
+    for column, dtype in schema.items():
+        if column not in df.columns:
+            typed[column] = pd.Series(pd.NA, index=df.index, dtype=dtype)
+            continue
+        values = df[column]
+        if pd.api.types.is_integer_dtype(pd.api.types.pandas_dtype(dtype)):
+            numbers = pd.to_numeric(values, errors="coerce")
+            bad = (numbers.isna() & values.notna()) | (numbers % 1 != 0).fillna(False)
+            if bad.any():
+                violations.append(f"{column}: {int(bad.sum())} non-integer values")
+            values = numbers.mask(bad)
+        elif str(dtype) in ("category", "string", "str"):
+            # Workbook cells come back as ints, floats or str; text labels
+            # must not mix types or the category cannot be snapshotted
+            values = values.astype("string")
+        typed[column] = values.astype(dtype)
+
+    result = pd.DataFrame(typed, index=df.index)
+    result.attrs["schema_violations"] = violations
+    return result
+
+
+def _raw_header(content):
+    """Header names exactly as the CSV engine will see them"""
+    first_line = content.split(b"\n", 1)[0].decode("utf-8-sig")
+    return next(csv.reader([first_line]), [])
+
+
+def parse_csv(content, schema=None):
+    """Parse raw CSV bytes with the pyarrow engine into a cleaned DataFrame
+
+    With a ``schema`` only its columns are read (``usecols``) and each one is
+    cast to its declared dtype, see ``apply_schema``.
+    """
+    if schema is None:
+        return clean_columns(pd.read_csv(BytesIO(content), engine="pyarrow"))
+
+    usecols = {}
+    for raw in _raw_header(content):
+        name = clean_name(raw)
+        if name in schema and name not in usecols.values():
+            usecols[raw] = name
+    if not usecols:
+        raise ValueError(f"none of the expected columns found: {', '.join(schema)}")
+    df = pd.read_csv(BytesIO(content), engine="pyarrow", usecols=list(usecols))
+    return apply_schema(df.rename(columns=usecols), schema)
+
+
+def parse_workbook(content, tabs=None):
+    """Parse a multi-sheet XLSX export into {tab name: cleaned DataFrame}
+
+    ``tabs`` maps the tabs to parse to a schema or None (default: every tab,
+    untyped). As with ``parse_csv``, a schema limits the columns read
+    (``usecols``) and casts them, see ``apply_schema``. Tabs missing from
+    the workbook, or without any of their schema's columns, are left out.
+    """
+    frames = {}
+    with pd.ExcelFile(BytesIO(content), engine=EXCEL_ENGINE) as workbook:
+        for name in workbook.sheet_names:
+            tab = name.strip()
+            if tabs is not None and tab not in tabs:
+                continue
+            schema = tabs.get(tab) if tabs else None
+            if schema is None:
+                frames[tab] = clean_columns(workbook.parse(name))
+                continue
+            df = workbook.parse(name, usecols=lambda column: clean_name(column) in schema)
+            try:
+                frames[tab] = apply_schema(clean_columns(df), schema)
+            except ValueError:
+                continue
+    return frames
+
+
+def content_hash(df):
+    """Stable hash of a frame's headers and values, used to detect real changes"""
+    digest = hashlib.sha256("\x1f".join(map(str, df.columns)).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=False).values.tobytes())
+    return digest.hexdigest()[:16]
+
+
+def backoff_delay(failures, base=RETRY_BASE, cap=DEFAULT_MAX_AGE):
+    """Exponential backoff with jitter: a random point in the upper half of base * 2**(n-1)"""
+    delay = min(cap, base * 2 ** max(failures - 1, 0))
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+class CircuitBreaker:
+    """Stop calling an endpoint that keeps failing
+
+    After ``threshold`` consecutive failures the circuit opens and calls are
+    refused for ``reset_timeout`` seconds. Then a single trial call is let
+    through (half-open); its outcome closes the circuit or opens it again.
+    """
+
+    def __init__(self, threshold=BREAKER_THRESHOLD, reset_timeout=BREAKER_RESET):
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self._trial = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        if self.opened_at is None:
+            return "closed"
+        if self._trial or time.time() - self.opened_at >= self.reset_timeout:
+            return "half-open"
+        return "open"
+
+    def allow(self):
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            if not self._trial and time.time() - self.opened_at >= self.reset_timeout:
+                self._trial = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self._trial or self.failures >= self.threshold:
+                self.opened_at = time.time()
+            self._trial = False
+
+
+class SingleFlight:
+    """Coalesce concurrent calls that share a key into a single execution
+
+    The first caller for a key runs the function; callers arriving while it
+    is in flight wait for and share its result (or exception).
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, fn, *args):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = Future()
+        if not leader:
+            return call.result()
+
+        try:
+            result = fn(*args)
+        except BaseException as e:
+            call.set_exception(e)
+            raise
+        else:
+            call.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+class SheetFetcher:
+    """Revalidating sheet fetcher built on one pooled session
+
+    The validators (ETag / Last-Modified), body and parsed result of the last
+    200 response are kept per URL, so later fetches are conditional GETs and
+    a 304 reuses the already-parsed data without touching pandas.
+    Concurrent requests for the same URL share one in-flight fetch, and each
+    URL sits behind a circuit breaker so a failing endpoint is not hammered.
+    """
+
+    def __init__(self, session=None):
+        self.session = session or create_session()
+        self.errors = {}
+        self._responses = {}
+        self._inflight = SingleFlight()
+        self._breakers = {}
+        self._lock = threading.Lock()
+
+    def load_csv_from_url(self, url, timeout=DEFAULT_TIMEOUT, schema=None):
+        """Load CSV from URL with error handling; the last failure per URL is kept in ``errors``"""
+        parse = partial(parse_csv, schema=schema) if schema else parse_csv
+        try:
+            return self._inflight.do(url, self._load, url, timeout, parse)
+        except Exception:
+            return pd.DataFrame()
+
+    def load_workbook(self, url, timeout=DEFAULT_TIMEOUT, tabs=None):
+        """Load tabs of a published workbook export as {tab: DataFrame}; {} on failure
+
+        ``tabs`` ({tab: schema or None}) picks and types the tabs, see ``parse_workbook``.
+        """
+        parse = partial(parse_workbook, tabs=tabs) if tabs else parse_workbook
+        try:
+            return self._inflight.do(url, self._load, url, timeout, parse)
+        except Exception:
+            return {}
+
+    def load_sheets(self, sources, deadline=None):
+        """Fetch every configured sheet concurrently and return {name: DataFrame}
+
+        ``sources`` maps a source name to a dict with a ``url``, an optional
+        ``timeout`` (connect, read) tuple and an optional ``schema``
+        ({column: dtype}). Failed sources, and sources still
+        running after ``deadline`` seconds, come back as empty frames; a late
+        fetch keeps running and still primes the response cache.
+        """
+        futures = {
+            name: _fetch_pool.submit(
+                self.load_csv_from_url, source["url"], source.get("timeout", DEFAULT_TIMEOUT),
+                source.get("schema"),
+            )
+            for name, source in sources.items()
+        }
+        end = None if deadline is None else time.monotonic() + deadline
+        frames = {}
+        for name, future in futures.items():
+            try:
+                frames[name] = future.result(None if end is None else max(end - time.monotonic(), 0))
+            except FutureTimeout:
+                self.errors[sources[name]["url"]] = f"no response within {deadline}s"
+                frames[name] = pd.DataFrame()
+        return frames
+
+    def forget(self, url):
+        """Drop the cached response for a URL so the next fetch is unconditional"""
+        with self._lock:
+            self._responses.pop(url, None)
+
+    def breaker(self, url):
+        with self._lock:
+            if url not in self._breakers:
+                self._breakers[url] = CircuitBreaker()
+            return self._breakers[url]
+
+    def _load(self, url, timeout, parse):
+        breaker = self.breaker(url)
+        if not breaker.allow():
+            self.errors[url] = "circuit open"
+            raise RuntimeError(f"circuit open for {url}")
+        try:
+            data = self._fetch(url, timeout, parse)
+        except Exception as e:
+            breaker.record_failure()
+            self.errors[url] = repr(e)
+            raise
+        breaker.record_success()
+        self.errors.pop(url, None)
+        return data
+
+    def _fetch(self, url, timeout, parse):
+        with self._lock:
+            cached = self._responses.get(url)
+
+        headers = {}
+        if cached is not None:
+            if cached["etag"]:
+                headers["If-None-Match"] = cached["etag"]
+            if cached["last_modified"]:
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        response = self.session.get(url, timeout=timeout, headers=headers)
+        if response.status_code == 304 and cached is not None:
+            return cached["data"]
+        response.raise_for_status()
+
+        data = parse(response.content)
+        with self._lock:
+            self._responses[url] = {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "body": response.content,
+                "data": data,
+            }
+        return data
+
+
+def write_snapshot(directory, frames):
+    """Persist frames as uncompressed Feather files plus a versioned manifest
+
+    Files are written to temporaries named per process and thread, then
+    renamed into place, so a concurrent reader never sees a half-written
+    snapshot and concurrent writers never share a temporary. Returns the
+    data version.
+    """
+    os.makedirs(directory, exist_ok=True)
+    token = f"{os.getpid()}.{threading.get_ident()}"
+    digest = hashlib.sha256()
+    for name in sorted(frames):
+        path = os.path.join(directory, f"{name}.feather")
+        tmp_path = f"{path}.{token}.tmp"
+        feather.write_feather(frames[name].reset_index(drop=True), tmp_path, compression="uncompressed")
+        with open(tmp_path, "rb") as f:
+            digest.update(name.encode())
+            digest.update(f.read())
+        os.replace(tmp_path, path)
+
+    version = digest.hexdigest()[:16]
+    manifest = {"version": version, "written_at": time.time(), "sources": sorted(frames)}
+    tmp_manifest = os.path.join(directory, f"{SNAPSHOT_MANIFEST}.{token}.tmp")
+    with open(tmp_manifest, "w") as f:
+        json.dump(manifest, f)
+    os.replace(tmp_manifest, os.path.join(directory, SNAPSHOT_MANIFEST))
+    return version
+
+
+def read_snapshot(directory):
+    """Memory-map the last snapshot; returns (frames, manifest) or (None, None)"""
+    try:
+        with open(os.path.join(directory, SNAPSHOT_MANIFEST)) as f:
+            manifest = json.load(f)
+        frames = {
+            name: feather.read_feather(os.path.join(directory, f"{name}.feather"), memory_map=True)
+            for name in manifest["sources"]
+        }
+        return frames, manifest
+    except Exception:
+        return None, None
+
+
+class SheetStore:
+    """Process-wide holder of the latest good sheet data (stale-while-revalidate)
+
+    At start-up the last on-disk snapshot is served immediately. Once a
+    source's data expires a revalidation runs in the background, and every
+    successful fetch is written back to the snapshot. ``start_refresher`` keeps
+    the data renewed ahead of expiry so script runs never wait on it.
+
+    Each source has its own refresh interval, starting at ``max_age``. After
+    every fetch its content hash is compared with the previous one: a change
+    halves the interval, no change grows it by half, always within
+    ``min_interval``..``max_interval``. Rarely edited sheets are therefore
+    polled less and busy ones more.
+
+    Failed fetches never replace data: the last good frame for a source keeps
+    being served while the refresher retries it with exponential backoff.
+
+    The snapshot is rewritten only when some source's content hash changed;
+    writes are serialized so the newest frames always land last.
+
+    With a ``workbook`` configured, every source that names a ``tab`` is read
+    from one multi-sheet export per refresh; sources whose tab is missing, or
+    all of them if the workbook fetch fails, fall back to their own CSV ``url``.
+    Those sources are scheduled as one unit, ``"workbook"``: one interval, one
+    hash over all their tabs and one backoff, since a single download serves
+    them all. Every other source is a unit of its own.
+    """
+
+    def __init__(self, sources, snapshot_dir=None, fetcher=None, max_age=DEFAULT_MAX_AGE,
+                 deadline=DEFAULT_DEADLINE, workbook=None, min_interval=DEFAULT_MIN_INTERVAL,
+                 max_interval=DEFAULT_MAX_INTERVAL):
+        self.sources = sources
+        self.workbook = workbook
+        self.snapshot_dir = snapshot_dir
+        self.fetcher = fetcher or SheetFetcher()
+        self.max_age = max_age
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.deadline = deadline
+        self.lead = 0
+        self.failures = 0
+        self.frames = {}
+        self.version = None
+        self.loaded_at = 0.0
+        self.last_success = None
+        self.last_error = None
+        self.snapshot_error = None
+        self.violations = {}
+        self.units = {
+            name: WORKBOOK_UNIT if workbook and source.get("tab") else name
+            for name, source in sources.items()
+        }
+        self.schedule = {
+            unit: {
+                "members": [name for name in sources if self.units[name] == unit],
+                "interval": min(max(max_age, min_interval), max_interval),
+                "expires_at": 0.0,
+                "retry_at": 0.0,
+                "failures": 0,
+                "hash": None,
+                "checks": 0,
+                "changes": deque(maxlen=CHANGE_HISTORY),
+            }
+            for unit in dict.fromkeys(self.units.values())
+        }
+        self._hashes = {}
+        self._lock = threading.Lock()
+        self._snapshot_lock = threading.Lock()
+        self._refreshing = False
+        self._pending = set()
+        self._refresher = None
+        self._stop = threading.Event()
+
+        if snapshot_dir:
+            frames, manifest = read_snapshot(snapshot_dir)
+            if frames:
+                self.frames = frames
+                self.version = manifest["version"]
+                self.loaded_at = manifest["written_at"]
+                self.last_success = manifest["written_at"]
+                self._hashes = {name: content_hash(df) for name, df in frames.items() if name in sources}
+                for entry in self.schedule.values():
+                    if any(name in self._hashes for name in entry["members"]):
+                        entry["hash"] = self._unit_hash(entry)
+                        entry["expires_at"] = manifest["written_at"] + entry["interval"]
+
+    def get(self):
+        """Return {name: DataFrame}, blocking only on the very first load
+
+        Sources that have never loaded come back as empty frames.
+        """
+        if not self.loaded_at:
+            self.refresh(deadline=self.deadline)
+        else:
+            now = time.time()
+            expired = [
+                name for entry in self.schedule.values()
+                if entry["expires_at"] <= now and self._next_refresh(entry) <= now
+                for name in entry["members"]
+            ]
+            if expired:
+                self.refresh_in_background(expired)
+        frames = self.frames
+        return {name: frames.get(name, pd.DataFrame()) for name in self.sources}
+
+    def refresh(self, names=None, deadline=None):
+        """Fetch the named sources (default: all) and swap in those that came back with data
+
+        Naming one source of a unit refreshes the whole unit.
+        """
+        units = list(dict.fromkeys(self.units[name] for name in (self.sources if names is None else names)))
+        names = [name for unit in units for name in self.schedule[unit]["members"]]
+        fetched = self._fetch_all(names, deadline)
+        good = {name: df for name, df in fetched.items() if not df.empty}
+        errors = [f"{name}: {self._source_error(name)}" for name in names if name not in good]
+        now = time.time()
+        changed = False
+        with self._lock:
+            frames = {**self.frames, **good}
+            self.loaded_at = now
+            self.frames = frames
+            for unit in units:
+                digests = {name: content_hash(good[name]) for name in self.schedule[unit]["members"] if name in good}
+                if digests:
+                    changed |= self._observe(unit, digests, now)
+                else:
+                    self._record_failure(unit, now)
+            if good:
+                self.last_success = now
+            self.violations.update({name: df.attrs.get("schema_violations", []) for name, df in good.items()})
+            self.last_error = "; ".join(errors) or None
+            self.failures = max(entry["failures"] for entry in self.schedule.values())
+        if changed and self.snapshot_dir:
+            self._write_snapshot()
+        return frames
+
+    def _write_snapshot(self):
+        """Persist the current frames; one writer at a time, always the latest frames
+
+        A failed write keeps serving from memory but is reported as
+        ``snapshot_error`` in ``status()`` until a later write succeeds.
+        """
+        with self._snapshot_lock:
+            try:
+                self.version = write_snapshot(self.snapshot_dir, self.frames)
+                self.snapshot_error = None
+            except Exception as e:
+                self.snapshot_error = repr(e)
+
+    def _unit_hash(self, entry):
+        """Hash over the last good content of every source in a unit"""
+        digest = hashlib.sha256()
+        for name in entry["members"]:
+            digest.update(f"{name}={self._hashes.get(name)};".encode())
+        return digest.hexdigest()[:16]
+
+    def _observe(self, unit, digests, now):
+        """Record a successful check of a unit ({source: content hash} for the
+        sources that came back) and adapt its interval; returns whether the content changed"""
+        entry = self.schedule[unit]
+        self._hashes.update(digests)
+        digest = self._unit_hash(entry)
+        changed = digest != entry["hash"]
+        if entry["hash"] is not None:
+            if changed:
+                entry["changes"].append(now)
+                factor = INTERVAL_SHRINK
+            else:
+                factor = INTERVAL_GROWTH
+            entry["interval"] = min(max(entry["interval"] * factor, self.min_interval), self.max_interval)
+        entry["hash"] = digest
+        entry["checks"] += 1
+        entry["failures"] = 0
+        entry["expires_at"] = now + entry["interval"]
+        return changed
+
+    def _record_failure(self, unit, now):
+        entry = self.schedule[unit]
+        entry["failures"] += 1
+        entry["retry_at"] = now + backoff_delay(entry["failures"], cap=entry["interval"])
+
+    def _next_refresh(self, entry):
+        """When the refresher should next fetch a source"""
+        if entry["failures"]:
+            return entry["retry_at"]
+        return entry["expires_at"] - min(self.lead, entry["interval"] / 2)
+
+    def _fetch_all(self, names, deadline):
+        """Pull the workbook once if needed, then fetch CSVs only for sources it did not cover"""
+        end = None if deadline is None else time.monotonic() + deadline
+        fetched = {}
+        if self.workbook and any(self.sources[name].get("tab") for name in names):
+            url = self.workbook["url"]
+            wanted = {source["tab"]: source.get("schema") for source in self.sources.values() if source.get("tab")}
+            future = _fetch_pool.submit(
+                self.fetcher.load_workbook, url, self.workbook.get("timeout", DEFAULT_TIMEOUT), wanted,
+            )
+            try:
+                tabs = future.result(deadline)
+            except FutureTimeout:
+                self.fetcher.errors[url] = f"no response within {deadline}s"
+                tabs = {}
+            for name, source in self.sources.items():
+                if source.get("tab") in tabs:
+                    fetched[name] = tabs[source["tab"]]
+
+        fallback = {
+            name: self.sources[name] for name in names
+            if name not in fetched and self.sources[name].get("url")
+        }
+        if fallback:
+            remaining = None if end is None else max(end - time.monotonic(), 0)
+            fetched.update(self.fetcher.load_sheets(fallback, deadline=remaining))
+        for name in names:
+            fetched.setdefault(name, pd.DataFrame())
+        return fetched
+
+    def _source_error(self, name):
+        errors = self.fetcher.errors
+        url = self.sources[name].get("url")
+        if url in errors:
+            return errors[url]
+        if self.workbook and self.workbook["url"] in errors:
+            return f"workbook: {errors[self.workbook['url']]}"
+        return "empty sheet"
+
+    def refresh_in_background(self, names=None):
+        """Queue sources for revalidation, starting a thread unless one is already running"""
+        with self._lock:
+            self._pending.update(self.sources if names is None else names)
+            if self._refreshing:
+                return
+            self._refreshing = True
+
+        def run():
+            while True:
+                with self._lock:
+                    pending = list(self._pending)
+                    self._pending.clear()
+                    if not pending:
+                        self._refreshing = False
+                        return
+                try:
+                    self.refresh(pending)
+                except Exception as e:
+                    self.last_error = repr(e)
+
+        threading.Thread(target=run, name="sheet-revalidate", daemon=True).start()
+
+    def invalidate(self, name):
+        """Expire one source now and refetch it unconditionally in the background"""
+        source = self.sources[name]
+        self.fetcher.forget(source.get("url"))
+        if self.workbook and source.get("tab"):
+            self.fetcher.forget(self.workbook["url"])
+        with self._lock:
+            entry = self.schedule[self.units[name]]
+            entry["expires_at"] = 0.0
+            entry["retry_at"] = 0.0
+            entry["failures"] = 0
+        self.refresh_in_background([name])
+
+    def start_refresher(self, lead=30):
+        """Start a daemon thread that renews each source ``lead`` seconds before it expires"""
+        with self._lock:
+            if self._refresher is not None:
+                return
+            self.lead = lead
+            self._refresher = threading.Thread(target=self._refresh_loop, name="sheet-refresher", daemon=True)
+        self._refresher.start()
+
+    def stop_refresher(self):
+        """Ask the refresher thread to exit after its current wait"""
+        self._stop.set()
+
+    def status(self):
+        """Refresher health, per-unit intervals and change history for monitoring"""
+        circuits = {
+            name: self.fetcher.breaker(source["url"]).state
+            for name, source in self.sources.items() if source.get("url")
+        }
+        if self.workbook:
+            circuits["workbook"] = self.fetcher.breaker(self.workbook["url"]).state
+        return {
+            "version": self.version,
+            "loaded_at": self.loaded_at,
+            "last_success": self.last_success,
+            "last_error": self.last_error,
+            "snapshot_error": self.snapshot_error,
+            "failures": self.failures,
+            "schema_violations": {name: found for name, found in self.violations.items() if found},
+            "circuits": circuits,
+            "sources": {
+                unit: {
+                    "members": list(entry["members"]),
+                    "interval": entry["interval"],
+                    "expires_at": entry["expires_at"],
+                    "next_refresh": self._next_refresh(entry),
+                    "checks": entry["checks"],
+                    "changes": list(entry["changes"]),
+                    "failures": entry["failures"],
+                }
+                for unit, entry in self.schedule.items()
+            },
+            "refresher_running": self._refresher is not None and self._refresher.is_alive(),
+        }
+
+    def _refresh_loop(self):
+        while True:
+            due_at = min(self._next_refresh(entry) for entry in self.schedule.values())
+            if self._stop.wait(max(due_at - time.time(), 0)):
+                return
+            now = time.time()
+            due = [unit for unit, entry in self.schedule.items() if self._next_refresh(entry) <= now]
+            try:
+                self.refresh([name for unit in due for name in self.schedule[unit]["members"]])
+            except Exception as e:
+                with self._lock:
+                    self.loaded_at = time.time()
+                    self.last_error = repr(e)
+                    for unit in due:
+                        self._record_failure(unit, self.loaded_at)
+                    self.failures = max(entry["failures"] for entry in self.schedule.values())
+
+
+def start_invalidation_server(store, token, host="127.0.0.1", port=8765, extra_status=None):
+    """Serve a small authenticated hook that lets sheet edits push a refresh
+
+    ``POST /invalidate/<source>`` expires that source and refetches it in the
+    background; ``GET /status`` returns ``store.status()``, merged with
+    ``extra_status()`` ({section: payload}) when given. Both require an
+    ``Authorization: Bearer <token>`` header. Returns the running server.
+    """
+
+    class InvalidationHandler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            if not self._authorized():
+                return self._reply(401, {"error": "unauthorized"})
+            prefix = "/invalidate/"
+            name = unquote(self.path[len(prefix):]) if self.path.startswith(prefix) else None
+            if name not in store.sources:
+                return self._reply(404, {"error": "unknown source"})
+            store.invalidate(name)
+            self._reply(202, {"invalidated": name})
+
+        def do_GET(self):
+            if not self._authorized():
+                return self._reply(401, {"error": "unauthorized"})
+            if self.path != "/status":
+                return self._reply(404, {"error": "not found"})
+            status = store.status()
+            if extra_status is not None:
+                status.update(extra_status())
+            self._reply(200, status)
+
+        def _authorized(self):
+            supplied = self.headers.get("Authorization", "")
+            return hmac.compare_digest(supplied.encode(), f"Bearer {token}".encode())
+
+        def _reply(self, code, payload):
+            body = json.dumps(payload, default=str).encode()
+            self.send_response(code)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), InvalidationHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="sheet-invalidation", daemon=True).start()
+    return server
@@ -0,0 +1,91 @@
+"""Per-rerun allocations of the stored-document path (no network, no rendering)"""
+import os
+import tracemalloc
+
+import pytest
+
+import artifacts
+import render_service
+import reports
+
+RERUNS = 20
+# Bytes a rerun may allocate regardless of document size (keys, paths, locks)
+RERUN_ALLOWANCE = 64 * 1024
+
+
+def store_document(store, name, size):
+    """Write a fake document of ``size`` bytes under the key RenderService uses for ``name``"""
+    key = store.key(name, reports.DOCUMENTS[name]["version"])
+    artifacts.write_atomic(store.path(key), os.urandom(size))
+    return key
+
+
+def peak_allocation(rerun):
+    """Peak traced bytes allocated while calling ``rerun`` RERUNS times"""
+    rerun()
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        for _ in range(RERUNS):
+            rerun()
+        return tracemalloc.get_traced_memory()[1] - baseline
+    finally:
+        tracemalloc.stop()
+
+
+@pytest.fixture
+def store(tmp_path):
+    return artifacts.ArtifactStore(str(tmp_path))
+
+
+@pytest.fixture
+def service(store):
+    service = render_service.RenderService(store, max_workers=1)
+    yield service
+    service._pool.shutdown()
+
+
+@pytest.mark.parametrize("size", [256 * 1024, 16 * 1024 * 1024])
+def test_load_returns_the_same_bytes_every_rerun(store, size):
+    key = store_document(store, "charter", size)
+    first = store.load(key)
+    assert len(first) == size
+    assert store.load(key) is first
+    assert peak_allocation(lambda: store.load(key)) < RERUN_ALLOWANCE
+
+
+@pytest.mark.parametrize("size", [256 * 1024, 16 * 1024 * 1024])
+def test_render_of_a_stored_document_does_not_copy_it(store, service, size):
+    key = store_document(store, "charter", size)
+    first = service.render("charter")
+    assert service.render("charter") is first is store.load(key)
+    assert peak_allocation(lambda: service.render("charter")) < RERUN_ALLOWANCE
+
+
+def test_documents_over_the_memory_limit_are_read_each_time(tmp_path):
+    store = artifacts.ArtifactStore(str(tmp_path), memory_limit=1024)
+    key = store_document(store, "report", 4096)
+    assert store.load(key) == store.load(key)
+    assert store.load(key) is not store.load(key)
+
+
+def test_publish_keeps_the_newest_versions(tmp_path):
+    store = artifacts.ArtifactStore(str(tmp_path / "store"), keep_versions=2)
+    published = tmp_path / "published"
+    keys = []
+    for version in range(4):
+        key = store.key("report", version)
+        artifacts.write_atomic(store.path(key), f"report version {version}".encode())
+        store.load(key)
+        keys.append(key)
+        store.publish(key, str(published), "report.pdf")
+    assert sorted(os.listdir(store.directory)) == sorted(f"{key}.pdf" for key in keys[-2:])
+    assert len(os.listdir(published)) == 2
+    assert store.load(keys[0]) is None
+
+    # Publishing an older version again makes it current, so it survives the next prune
+    store.publish(keys[2], str(published), "report.pdf")
+    key = store.key("report", 4)
+    artifacts.write_atomic(store.path(key), b"report version 4")
+    store.publish(key, str(published), "report.pdf")
+    assert sorted(os.listdir(store.directory)) == sorted(f"{key}.pdf" for key in (keys[2], key))
@@ -0,0 +1,37 @@
+"""Which renders RenderService queues in the background"""
+import pytest
+
+import artifacts
+import render_service
+import reports
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    # Known to the parent but not to the workers, which import reports afresh: every render fails
+    monkeypatch.setitem(reports.DOCUMENTS, "broken", {**reports.DOCUMENTS["charter"], "file_name": "broken.pdf"})
+    service = render_service.RenderService(artifacts.ArtifactStore(str(tmp_path)), max_workers=1)
+    yield service
+    service._pool.shutdown()
+
+
+def test_prefetch_ignores_documents_never_downloaded(service):
+    key = service.prefetch("charter")
+    assert service.status(key) == "unknown"
+    assert not service._jobs
+
+
+def test_failed_documents_are_not_prefetched_during_backoff(service):
+    with pytest.raises(KeyError):
+        service.render("broken", timeout=60)
+    key = service.key("broken")
+    assert service.status(key) == "failed"
+    assert service.prefetch("broken") == key
+    assert service.status(key) == "failed"
+    assert not service._jobs
+
+    service._retry_at[key] = 0
+    service.prefetch("broken")
+    with pytest.raises(KeyError):
+        service.result(key, timeout=60)
+    assert service._failures[key] == 2
@@ -0,0 +1,184 @@
+"""Sheet parsing, fetching and snapshots against a local HTTP stub"""
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+
+import pandas as pd
+import pytest
+
+import dashboard_data
+import sheet_loader
+
+CERTS = pd.DataFrame({
+    "Certification": ["PMP", "Agile Coach", "Scrum Master"],
+    "Issuer": ["PMI", 2025, 2019],
+    "Year": [2020, 2025, 2019],
+    "Domain": ["Project", "Agile", "Agile"],
+})
+
+
+class SheetStub:
+    """Serves one CSV body with an ETag; ``status`` and ``delay`` are set per test"""
+
+    def __init__(self, body):
+        self.body = body
+        self.etag = '"v1"'
+        self.status = 200
+        self.delay = 0
+        self.requests = []
+
+    def handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                stub.requests.append(dict(self.headers))
+                time.sleep(stub.delay)
+                if stub.status != 200:
+                    self.send_response(stub.status)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                elif self.headers.get("If-None-Match") == stub.etag:
+                    self.send_response(304)
+                    self.send_header("ETag", stub.etag)
+                    self.end_headers()
+                else:
+                    self.send_response(200)
+                    self.send_header("ETag", stub.etag)
+                    self.send_header("Content-Length", str(len(stub.body)))
+                    self.end_headers()
+                    self.wfile.write(stub.body)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+
+@pytest.fixture
+def stub():
+    sheet = SheetStub(CERTS.to_csv(index=False).encode())
+    server = ThreadingHTTPServer(("127.0.0.1", 0), sheet.handler())
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    sheet.url = f"http://127.0.0.1:{server.server_address[1]}/certs.csv"
+    yield sheet
+    server.shutdown()
+    server.server_close()
+
+
+def wait_for(condition, timeout=5):
+    end = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < end, "timed out"
+        time.sleep(0.01)
+
+
+def workbook_bytes(tabs):
+    """XLSX bytes with one sheet per ``{tab: frame}``"""
+    buffer = BytesIO()
+    with pd.ExcelWriter(buffer, engine="openpyxl") as writer:
+        for tab, frame in tabs.items():
+            frame.to_excel(writer, sheet_name=tab, index=False)
+    return buffer.getvalue()
+
+
+def test_workbook_numeric_categories_snapshot(tmp_path):
+    content = workbook_bytes({"Certifications": CERTS})
+    frames = sheet_loader.parse_workbook(content, {"Certifications": dashboard_data.CERTS_SCHEMA})
+    certs = frames["Certifications"]
+    assert list(certs["Issuer"]) == ["PMI", "2025", "2019"]
+
+    version = sheet_loader.write_snapshot(str(tmp_path), {"certs": certs})
+    restored, manifest = sheet_loader.read_snapshot(str(tmp_path))
+    assert manifest["version"] == version
+    assert sheet_loader.content_hash(restored["certs"]) == sheet_loader.content_hash(certs)
+
+
+def test_workbook_and_csv_parse_alike():
+    schema = dashboard_data.CERTS_SCHEMA
+    from_csv = sheet_loader.parse_csv(CERTS.to_csv(index=False).encode(), schema)
+    from_workbook = sheet_loader.parse_workbook(workbook_bytes({"Certifications": CERTS}), {"Certifications": schema})
+    from_workbook = from_workbook["Certifications"]
+    assert dict(from_csv.dtypes) == dict(from_workbook.dtypes)
+    assert sheet_loader.content_hash(from_csv) == sheet_loader.content_hash(from_workbook)
+
+
+def test_failed_snapshot_is_reported(tmp_path):
+    blocked = tmp_path / "snapshot"
+    blocked.write_text("not a directory")
+    store = sheet_loader.SheetStore({"certs": {"url": "http://127.0.0.1:9/certs.csv"}}, snapshot_dir=str(blocked))
+    store.frames = {"certs": CERTS.astype({"Issuer": "string"})}
+    store._write_snapshot()
+    assert store.status()["snapshot_error"]
+
+    store.snapshot_dir = str(tmp_path / "ok")
+    store._write_snapshot()
+    assert store.status()["snapshot_error"] is None
+    assert store.status()["version"]
+
+
+def test_not_modified_reuses_parsed_frame(stub):
+    fetcher = sheet_loader.SheetFetcher()
+    first = fetcher.load_csv_from_url(stub.url, schema=dashboard_data.CERTS_SCHEMA)
+    second = fetcher.load_csv_from_url(stub.url, schema=dashboard_data.CERTS_SCHEMA)
+    assert second is first
+    assert len(stub.requests) == 2
+    assert stub.requests[1]["If-None-Match"] == stub.etag
+
+
+def test_concurrent_misses_share_one_request(stub):
+    fetcher = sheet_loader.SheetFetcher()
+    stub.delay = 0.3
+    callers = 8
+    start = threading.Barrier(callers)
+    results = []
+
+    def load():
+        start.wait()
+        results.append(fetcher.load_csv_from_url(stub.url))
+
+    threads = [threading.Thread(target=load) for _ in range(callers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(stub.requests) == 1
+    assert len(results) == callers and all(df is results[0] for df in results)
+
+
+def test_circuit_opens_then_lets_one_trial_through(stub):
+    fetcher = sheet_loader.SheetFetcher()
+    breaker = fetcher.breaker(stub.url)
+    breaker.reset_timeout = 0.2
+    stub.status = 500
+    for _ in range(sheet_loader.BREAKER_THRESHOLD):
+        assert fetcher.load_csv_from_url(stub.url).empty
+    assert breaker.state == "open"
+    assert fetcher.load_csv_from_url(stub.url).empty
+    assert len(stub.requests) == sheet_loader.BREAKER_THRESHOLD
+    assert fetcher.errors[stub.url] == "circuit open"
+
+    time.sleep(breaker.reset_timeout)
+    stub.status = 200
+    stub.delay = 0.3
+    trial = threading.Thread(target=fetcher.load_csv_from_url, args=(stub.url,))
+    trial.start()
+    wait_for(lambda: len(stub.requests) == sheet_loader.BREAKER_THRESHOLD + 1)
+    assert breaker.state == "half-open"
+    assert not breaker.allow()
+    trial.join()
+    assert breaker.state == "closed"
+    assert len(stub.requests) == sheet_loader.BREAKER_THRESHOLD + 1
+
+
+def test_snapshot_round_trip_keeps_content_hash(stub, tmp_path):
+    sources = {"certs": {"url": stub.url, "schema": dashboard_data.CERTS_SCHEMA}}
+    store = sheet_loader.SheetStore(sources, snapshot_dir=str(tmp_path))
+    frames = store.get()
+    assert store.status()["version"] and store.status()["snapshot_error"] is None
+
+    restarted = sheet_loader.SheetStore(sources, snapshot_dir=str(tmp_path))
+    assert restarted.version == store.version
+    assert restarted.schedule["certs"]["hash"] == store.schedule["certs"]["hash"]
+    assert sheet_loader.content_hash(restarted.frames["certs"]) == sheet_loader.content_hash(frames["certs"])